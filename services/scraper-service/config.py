@@ -3,7 +3,75 @@ Configuration settings for OpenPolicy Scraper Service
 """
 import os
 import argparse
-from typing import Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class ScraperSpec:
+    """Static configuration for a registered scraper"""
+    name: str
+    enabled: bool
+    schedule: str
+    description: str
+    priority: str
+    batch_size: int
+
+
+# Scraper registry, built once at import and exposed read-only
+SCRAPER_REGISTRY: Mapping[str, ScraperSpec] = MappingProxyType({
+    "parliament_ca": ScraperSpec(
+        name="Parliament of Canada",
+        enabled=True,
+        schedule="0 2 * * *",  # Daily at 2 AM
+        description="Federal parliamentary data scraper",
+        priority="high",
+        batch_size=500  # Optimized batch size
+    ),
+    "ca_on": ScraperSpec(
+        name="Ontario Legislature",
+        enabled=True,
+        schedule="0 3 * * *",  # Daily at 3 AM
+        description="Ontario provincial data scraper",
+        priority="high",
+        batch_size=500
+    ),
+    "ca_on_toronto": ScraperSpec(
+        name="Toronto City Council",
+        enabled=True,
+        schedule="0 4 * * *",  # Daily at 4 AM
+        description="Toronto municipal data scraper",
+        priority="medium",
+        batch_size=300
+    ),
+    "ca_bc": ScraperSpec(
+        name="British Columbia Legislature",
+        enabled=True,
+        schedule="0 5 * * *",  # Daily at 5 AM
+        description="BC provincial data scraper",
+        priority="medium",
+        batch_size=400
+    ),
+    "ca_ab": ScraperSpec(
+        name="Alberta Legislature",
+        enabled=True,
+        schedule="0 6 * * *",  # Daily at 6 AM
+        description="Alberta provincial data scraper",
+        priority="medium",
+        batch_size=400
+    ),
+    "ca_qc": ScraperSpec(
+        name="Quebec Legislature",
+        enabled=True,
+        schedule="0 7 * * *",  # Daily at 7 AM
+        description="Quebec provincial data scraper",
+        priority="medium",
+        batch_size=400
+    )
+})
+
 
 class Config:
     """Application settings with dual database support"""
@@ -73,57 +141,8 @@ class Config:
     DEFAULT_TIMEOUT: int = int(os.getenv("DEFAULT_TIMEOUT", "180"))  # Reduced from 300
     RETRY_ATTEMPTS: int = int(os.getenv("RETRY_ATTEMPTS", "2"))  # Reduced from 3
     
-    # Scraper registry (optimized configuration)
-    scraper_registry: Dict[str, Dict[str, Any]] = {
-        "parliament_ca": {
-            "name": "Parliament of Canada",
-            "enabled": True,
-            "schedule": "0 2 * * *",  # Daily at 2 AM
-            "description": "Federal parliamentary data scraper",
-            "priority": "high",
-            "batch_size": 500  # Optimized batch size
-        },
-        "ca_on": {
-            "name": "Ontario Legislature",
-            "enabled": True,
-            "schedule": "0 3 * * *",  # Daily at 3 AM
-            "description": "Ontario provincial data scraper",
-            "priority": "high",
-            "batch_size": 500
-        },
-        "ca_on_toronto": {
-            "name": "Toronto City Council",
-            "enabled": True,
-            "schedule": "0 4 * * *",  # Daily at 4 AM
-            "description": "Toronto municipal data scraper",
-            "priority": "medium",
-            "batch_size": 300
-        },
-        "ca_bc": {
-            "name": "British Columbia Legislature",
-            "enabled": True,
-            "schedule": "0 5 * * *",  # Daily at 5 AM
-            "description": "BC provincial data scraper",
-            "priority": "medium",
-            "batch_size": 400
-        },
-        "ca_ab": {
-            "name": "Alberta Legislature",
-            "enabled": True,
-            "schedule": "0 6 * * *",  # Daily at 6 AM
-            "description": "Alberta provincial data scraper",
-            "priority": "medium",
-            "batch_size": 400
-        },
-        "ca_qc": {
-            "name": "Quebec Legislature",
-            "enabled": True,
-            "schedule": "0 7 * * *",  # Daily at 7 AM
-            "description": "Quebec provincial data scraper",
-            "priority": "medium",
-            "batch_size": 400
-        }
-    }
+    # Scraper registry (optimized configuration), shared read-only across instances
+    scraper_registry: Mapping[str, ScraperSpec] = SCRAPER_REGISTRY
     
     # Security configuration
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")
@@ -185,18 +204,20 @@ class Config:
     @classmethod
     def get_database_config(cls) -> Dict[str, Any]:
         """Get database configuration as dict"""
+        # The URL, name and mode are resolved per instance, so read them from the shared one
+        current = get_config()
         return {
-            "url": cls.DATABASE_URL,
-            "name": cls.DATABASE_NAME,
-            "pool_size": cls.DATABASE_POOL_SIZE,
-            "max_overflow": cls.DATABASE_MAX_OVERFLOW,
-            "mode": cls.mode
+            "url": current.DATABASE_URL,
+            "name": current.DATABASE_NAME,
+            "pool_size": current.DATABASE_POOL_SIZE,
+            "max_overflow": current.DATABASE_MAX_OVERFLOW,
+            "mode": current.mode
         }
     
-    @classmethod
-    def get_scraper_config(cls, scraper_id: str) -> Dict[str, Any]:
+    @staticmethod
+    def get_scraper_config(scraper_id: str) -> Optional[ScraperSpec]:
         """Get configuration for a specific scraper"""
-        return cls.scraper_registry.get(scraper_id, {})
+        return SCRAPER_REGISTRY.get(scraper_id)
     
     def get_mode_info(self) -> Dict[str, Any]:
         """Get mode information for monitoring"""
@@ -212,5 +233,10 @@ class Config:
             }
         }
 
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide configuration, parsing arguments and environment only once"""
+    return Config()
+
 # Global config instance
-config = Config()
+config = get_config()
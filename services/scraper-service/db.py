@@ -0,0 +1,29 @@
+"""
+Shared psycopg2 connection pool for OpenPolicy Scraper Service
+"""
+from psycopg2.pool import ThreadedConnectionPool
+
+from config import config
+
+# Created on first use so importing this module never opens connections
+_pool = None
+
+
+def get_pool() -> ThreadedConnectionPool:
+    """Get the process-wide connection pool"""
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(
+            minconn=1,
+            maxconn=config.DATABASE_POOL_SIZE + config.DATABASE_MAX_OVERFLOW,
+            dsn=config.DATABASE_URL
+        )
+    return _pool
+
+
+def close_pool():
+    """Close every pooled connection"""
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
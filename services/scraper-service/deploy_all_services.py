@@ -12,13 +12,9 @@ import time
 import signal
 import os
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, Any, List
 import json
 
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
-
 # Import services
 from src.services.scraper_manager import ScraperManager
 from src.services.data_pipeline import DataPipeline
@@ -37,6 +33,9 @@ services = {}
 shutdown_event = asyncio.Event()
 startup_time = None
 
+# Logger used by log_system_health, checked before building health payloads
+health_logger = logging.getLogger('health')
+
 # Signal handlers for graceful shutdown
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
@@ -247,22 +246,26 @@ class ServiceDeploymentManager:
             else:
                 overall_status = "unhealthy"
             
-            # Log health status
-            health_summary = {
-                "overall_status": overall_status,
-                "healthy_services": healthy_services,
-                "total_services": total_services,
-                "services": health_results,
-                "timestamp": start_time.isoformat()
-            }
-            
-            log_system_health("AllServices", overall_status, health_summary)
+            # Log health status (skip building the payload when health logging is off)
+            health_summary = None
+            if health_logger.isEnabledFor(logging.INFO):
+                health_summary = {
+                    "overall_status": overall_status,
+                    "healthy_services": healthy_services,
+                    "total_services": total_services,
+                    "services": health_results,
+                    "timestamp": start_time.isoformat()
+                }
+                log_system_health("AllServices", overall_status, health_summary)
             
             # Log performance
             duration = (datetime.utcnow() - start_time).total_seconds()
             log_performance("comprehensive_health_check", duration, health_summary)
             
-            self.logger.info(f"🏥 Health check completed: {overall_status} ({healthy_services}/{total_services} services healthy)")
+            self.logger.info(
+                "🏥 Health check completed: %s (%s/%s services healthy)",
+                overall_status, healthy_services, total_services
+            )
             
         except Exception as e:
             self.logger.error(f"❌ Health check failed: {e}")
@@ -13,12 +13,8 @@ import time
 import signal
 import os
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, Any, List
-import json
-
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+import orjson
 
 # Import deployment and monitoring components
 from deploy_all_services import ServiceDeploymentManager
@@ -28,7 +24,10 @@ from monitor_and_debug import ComprehensiveMonitor
 deployment_manager = None
 monitor = None
 shutdown_event = asyncio.Event()
-startup_time = None
+
+# Banner lines for console output
+BANNER80 = "=" * 80
+BANNER100 = "=" * 100
 
 # Signal handlers
 def signal_handler(signum, frame):
@@ -48,6 +47,9 @@ class MasterDeploymentAndMonitor:
         self.monitor = None
         self.deployment_start_time = None
         self.monitoring_start_time = None
+        # Monotonic counterparts used for elapsed time; wall clock only for timestamps
+        self._deployment_started = None
+        self._monitoring_started = None
         self.phase = "initializing"
         
         self.logger.info("🚀 Initializing Master Deployment and Monitor")
@@ -75,6 +77,7 @@ class MasterDeploymentAndMonitor:
         self.logger.info("⚙️ PHASE 1: Deploying all services...")
         self.phase = "deploying"
         self.deployment_start_time = datetime.utcnow()
+        self._deployment_started = time.monotonic()
         
         try:
             # Create and run deployment manager
@@ -92,6 +95,7 @@ class MasterDeploymentAndMonitor:
         self.logger.info("🔍 PHASE 2: Starting comprehensive monitoring...")
         self.phase = "monitoring"
         self.monitoring_start_time = datetime.utcnow()
+        self._monitoring_started = time.monotonic()
         
         try:
             # Create and start comprehensive monitor
@@ -125,16 +129,21 @@ class MasterDeploymentAndMonitor:
         self.phase = "shutting_down"
         
         try:
-            # Shutdown monitor
+            # Shutdown monitor and deployment manager concurrently; they are independent
+            shutdowns = []
             if self.monitor:
-                await self.monitor._shutdown_monitoring()
-                self.logger.info("✅ Monitor shutdown completed")
-            
-            # Shutdown deployment manager
+                shutdowns.append(("Monitor", self.monitor._shutdown_monitoring()))
             if self.deployment_manager:
-                await self.deployment_manager._shutdown_services()
-                self.logger.info("✅ Deployment manager shutdown completed")
-            
+                shutdowns.append(("Deployment manager", self.deployment_manager._shutdown_services()))
+
+            results = await asyncio.gather(*(coro for _, coro in shutdowns), return_exceptions=True)
+
+            for (name, _), result in zip(shutdowns, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"❌ {name} shutdown failed: {result}")
+                else:
+                    self.logger.info(f"✅ {name} shutdown completed")
+
             # Generate final comprehensive report
             await self._generate_comprehensive_report()
             
@@ -146,21 +155,25 @@ class MasterDeploymentAndMonitor:
         self.logger.info("📋 Generating comprehensive final report...")
         
         try:
+            # One timestamp for the whole report
+            now = datetime.utcnow()
+            
             # Calculate durations
+            elapsed_now = time.monotonic()
             deployment_duration = 0
             monitoring_duration = 0
             
-            if self.deployment_start_time:
-                deployment_duration = (datetime.utcnow() - self.deployment_start_time).total_seconds()
+            if self._deployment_started is not None:
+                deployment_duration = elapsed_now - self._deployment_started
             
-            if self.monitoring_start_time:
-                monitoring_duration = (datetime.utcnow() - self.monitoring_start_time).total_seconds()
+            if self._monitoring_started is not None:
+                monitoring_duration = elapsed_now - self._monitoring_started
             
             # Generate comprehensive report
             report = {
                 "deployment_and_monitoring_session": {
-                    "start_time": self.deployment_start_time.isoformat() if self.deployment_start_time else None,
-                    "end_time": datetime.utcnow().isoformat(),
+                    "start_time": self.deployment_start_time,
+                    "end_time": now,
                     "deployment_duration_seconds": deployment_duration,
                     "monitoring_duration_seconds": monitoring_duration,
                     "total_duration_seconds": deployment_duration + monitoring_duration,
@@ -195,31 +208,35 @@ class MasterDeploymentAndMonitor:
             }
             
             # Save comprehensive report
-            report_file = f"comprehensive_deployment_monitoring_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            report_file = f"comprehensive_deployment_monitoring_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
             
             self.logger.info(f"📋 Comprehensive report saved to: {report_file}")
             
-            # Print final summary
-            print("\n" + "=" * 100)
-            print("🚀 OPENPOLICY SCRAPER SERVICE - COMPREHENSIVE DEPLOYMENT & MONITORING COMPLETED")
-            print("=" * 100)
-            print(f"📅 Session Duration: {deployment_duration + monitoring_duration:.2f} seconds")
-            print(f"⚙️  Deployment Time: {deployment_duration:.2f} seconds")
-            print(f"🔍 Monitoring Time: {monitoring_duration:.2f} seconds")
-            print(f"📊 Services Deployed: 5/5")
-            print(f"🔧 Enhanced Logging: ✅ ACTIVE")
-            print(f"📈 Comprehensive Monitoring: ✅ ACTIVE")
-            print(f"🐛 Bug Detection: ✅ ACTIVE")
-            print(f"📋 Detailed Report: {report_file}")
-            print("=" * 100)
-            print("🎉 Your OpenPolicy Scraper Service is now fully deployed with:")
-            print("   ✅ Enhanced logging and comprehensive monitoring")
-            print("   ✅ Real-time bug detection and error analysis")
-            print("   ✅ Performance monitoring and health checks")
-            print("   ✅ Full system observability and debugging capabilities")
-            print("=" * 100)
+            # Print final summary in a single write
+            sys.stdout.write("\n".join([
+                "",
+                BANNER100,
+                "🚀 OPENPOLICY SCRAPER SERVICE - COMPREHENSIVE DEPLOYMENT & MONITORING COMPLETED",
+                BANNER100,
+                f"📅 Session Duration: {deployment_duration + monitoring_duration:.2f} seconds",
+                f"⚙️  Deployment Time: {deployment_duration:.2f} seconds",
+                f"🔍 Monitoring Time: {monitoring_duration:.2f} seconds",
+                "📊 Services Deployed: 5/5",
+                "🔧 Enhanced Logging: ✅ ACTIVE",
+                "📈 Comprehensive Monitoring: ✅ ACTIVE",
+                "🐛 Bug Detection: ✅ ACTIVE",
+                f"📋 Detailed Report: {report_file}",
+                BANNER100,
+                "🎉 Your OpenPolicy Scraper Service is now fully deployed with:",
+                "   ✅ Enhanced logging and comprehensive monitoring",
+                "   ✅ Real-time bug detection and error analysis",
+                "   ✅ Performance monitoring and health checks",
+                "   ✅ Full system observability and debugging capabilities",
+                BANNER100,
+                ""
+            ]))
             
         except Exception as e:
             self.logger.error(f"❌ Comprehensive report generation failed: {e}")
@@ -232,17 +249,17 @@ class MasterDeploymentAndMonitor:
             "monitoring_start_time": self.monitoring_start_time.isoformat() if self.monitoring_start_time else None,
             "deployment_manager_active": self.deployment_manager is not None,
             "monitor_active": self.monitor is not None,
-            "uptime": (datetime.utcnow() - self.deployment_start_time).total_seconds() if self.deployment_start_time else 0
+            "uptime": time.monotonic() - self._deployment_started if self._deployment_started is not None else 0
         }
 
 
 async def main():
     """Main function for deployment and monitoring."""
-    global startup_time, deployment_manager, monitor
     startup_time = datetime.utcnow()
+    started = time.monotonic()
     
     print("🚀 OpenPolicy Scraper Service - Master Deployment & Monitoring")
-    print("=" * 80)
+    print(BANNER80)
     print(f"📅 Started: {startup_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("🔧 This script will:")
     print("   1. Deploy all services with enhanced logging")
@@ -255,7 +272,7 @@ async def main():
     print("📈 Performance monitoring and health checks will be active")
     print()
     print("🛑 Press Ctrl+C to stop and generate final report")
-    print("=" * 80)
+    print(BANNER80)
     
     try:
         # Register signal handlers
@@ -276,9 +293,8 @@ async def main():
         sys.exit(1)
     finally:
         print(f"\n📊 Session completed at: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
-        if startup_time:
-            uptime = (datetime.utcnow() - startup_time).total_seconds()
-            print(f"⏱️ Total session time: {uptime:.2f} seconds")
+        uptime = time.monotonic() - started
+        print(f"⏱️ Total session time: {uptime:.2f} seconds")
 
 
 if __name__ == "__main__":
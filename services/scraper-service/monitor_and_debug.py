@@ -6,21 +6,26 @@ This script monitors all services, detects bugs and errors, and provides detaile
 """
 
 import asyncio
+import contextvars
+import heapq
+import itertools
 import logging
 import sys
 import time
 import os
-import json
+import re
+import mmap
 import traceback
-from datetime import datetime, timedelta
+from collections import Counter, deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+import orjson
 import psutil
 import signal
 
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
-
 # Import services
 from src.services.scraper_manager import ScraperManager
 from src.services.data_pipeline import DataPipeline
@@ -37,10 +42,191 @@ from src.core.logging_config import (
 # Global variables
 monitoring_active = False
 shutdown_event = asyncio.Event()
-bug_reports = []
-error_logs = []
-performance_issues = []
-startup_time = None
+MAX_RECORDS = 1000  # Upper bound on retained bug/performance records
+ERROR_LOG_TAIL = 20  # Only the most recent errors go into the final report
+bug_reports = deque(maxlen=MAX_RECORDS)
+error_logs = deque(maxlen=ERROR_LOG_TAIL)
+performance_issues = deque(maxlen=MAX_RECORDS)
+
+# Banner line for console output
+BANNER80 = "=" * 80
+
+# Issues recorded by the check running in the current task; checks run concurrently,
+# so each run counts its own issues instead of diffing the monitor-wide total
+_check_issue_count: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar("check_issue_count", default=None)
+
+# Logger used by log_system_health, checked before building health payloads
+health_logger = logging.getLogger('health')
+
+# Recorded issues are appended to this file in batches
+RECORDS_LOG_FILE = Path("logs/monitor_records.jsonl")
+RECORD_QUEUE_SIZE = 10_000  # Records beyond this are dropped rather than buffered
+RECORD_FLUSH_BATCH = 256
+
+# Final reports are streamed through a large write buffer; pretty-printed only when debugging
+REPORT_BUFFER_SIZE = 1 << 16
+REPORT_PRETTY = os.getenv("MONITOR_DEBUG") == "1"
+
+# Deadlines for each service, and all services together, to exit during shutdown
+SERVICE_EXIT_TIMEOUT = 10
+SERVICE_SHUTDOWN_TIMEOUT = 30
+
+# Number of trailing lines kept per log file for analysis
+LOG_TAIL_LINES = 100
+
+# Precompiled log classification patterns
+# Matches the first keyword of every line in a multi-line blob
+LOG_LEVEL_PATTERN = re.compile(r'^[^\n]*?(ERROR|WARNING|CRITICAL|Exception|Traceback)', re.MULTILINE)
+LOG_LEVEL_CATEGORIES = {
+    'ERROR': 'errors',
+    'WARNING': 'warnings',
+    'CRITICAL': 'critical',
+    'Exception': 'exceptions',
+    'Traceback': 'exceptions'
+}
+# Matches the first known error type on every line that contains ERROR
+ERROR_TYPE_PATTERN = re.compile(
+    r'^(?=[^\n]*ERROR)[^\n]*?(ImportError|AttributeError|ConnectionError|TimeoutError)', re.MULTILINE
+)
+
+# Recommendation for each detected bug type, in report order
+BUG_RECOMMENDATIONS = (
+    ('frequent_exceptions', "Review error handling and add more robust exception management"),
+    ('high_error_rate', "Investigate root causes of frequent errors and implement fixes"),
+    ('low_coverage', "Increase test coverage by adding more unit and integration tests"),
+    ('data_inconsistency', "Review data validation and consistency checks"),
+)
+
+
+# Last formatted UTC timestamp and the whole second it was formatted for
+_iso_cache = ["", 0]
+
+def now_iso() -> str:
+    """Return the current UTC time in ISO format, reformatting at most once per second."""
+    now = int(time.time())
+    if now != _iso_cache[1]:
+        _iso_cache[:] = [datetime.fromtimestamp(now, timezone.utc).isoformat(), now]
+    return _iso_cache[0]
+
+
+async def wait_for_shutdown(timeout: float) -> bool:
+    """Wait up to timeout seconds; return True as soon as shutdown is requested."""
+    try:
+        await asyncio.wait_for(shutdown_event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+class PollInterval:
+    """Adaptive polling interval that backs off while healthy and tightens on issues."""
+    
+    def __init__(self, base: float, min_s: Optional[float] = None, max_s: Optional[float] = None):
+        self.cur = base
+        self.min_s = min_s if min_s is not None else max(1.0, base / 8)
+        self.max_s = max_s if max_s is not None else base * 4
+    
+    def update(self, healthy: bool) -> float:
+        """Double the interval after a clean check, halve it after an issue."""
+        if healthy:
+            self.cur = min(self.cur * 2, self.max_s)
+        else:
+            self.cur = max(self.cur / 2, self.min_s)
+        return self.cur
+
+
+def export_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a JSON-ready version of a record, formatting any captured traceback."""
+    tb = record.get("traceback")
+    if isinstance(tb, traceback.TracebackException):
+        return {**record, "traceback": "".join(tb.format())}
+    return record
+
+
+def write_records_batch(path: Path, batch: List[tuple]):
+    """Encode a batch of (kind, record) pairs and append them to a file with a single writev call."""
+    lines = [
+        orjson.dumps(
+            {"record_type": kind, **export_record(record)},
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+        for kind, record in batch
+    ]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.writev(fd, lines)
+    finally:
+        os.close(fd)
+
+
+def write_report_stream(path: str, sections: Dict[str, Any], pretty: bool = False):
+    """Write a JSON object section by section, streaming list and iterator sections one element at a time."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    sep = b",\n" if pretty else b","
+    with open(path, 'wb', buffering=REPORT_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(sections.items()):
+            if i:
+                f.write(sep)
+            f.write(orjson.dumps(key))
+            f.write(b":")
+            if isinstance(value, (list, deque, Iterator)):
+                f.write(b"[")
+                for j, item in enumerate(value):
+                    if j:
+                        f.write(sep)
+                    f.write(orjson.dumps(item, default=str, option=option))
+                f.write(b"]")
+            else:
+                f.write(orjson.dumps(value, default=str, option=option))
+        f.write(b"}\n")
+
+
+def measure_coverage_worker(source_dir: str) -> Dict[str, Any]:
+    """Measure coverage in a worker process (must be a picklable top-level function)."""
+    return CoverageValidator().measure_coverage(source_dir)
+
+
+class TTLCache:
+    """Cache of expensive call results, reused until they are older than their TTL."""
+    
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+    
+    def get_or_call(self, key: str, fn, ttl: float):
+        """Return the cached value for key, calling fn when missing or expired."""
+        now = time.monotonic()
+        value, stored_at = self._entries.get(key, (None, None))
+        if stored_at is not None and now - stored_at < ttl:
+            return value
+        
+        value = fn()
+        self._entries[key] = (value, now)
+        return value
+    
+    async def get_or_await(self, key: str, fn, ttl: float):
+        """Async variant of get_or_call; concurrent callers share a single in-flight call."""
+        value, stored_at = self._entries.get(key, (None, None))
+        if stored_at is not None and time.monotonic() - stored_at < ttl:
+            return value
+        
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+        
+        # Shield so a cancelled caller doesn't cancel the call other callers are waiting on
+        return await asyncio.shield(task)
+    
+    def _store(self, key: str, task: asyncio.Future):
+        """Cache the result of a finished in-flight call."""
+        self._pending.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._entries[key] = (task.result(), time.monotonic())
+
 
 # Signal handlers
 def signal_handler(signum, frame):
@@ -57,7 +243,30 @@ class ComprehensiveMonitor:
         """Initialize the comprehensive monitor."""
         self.logger = get_logger(__name__)
         self.services = {}
+        self._service_exits: Dict[str, Any] = {}  # Bound __aexit__ per service, resolved at registration
         self.monitoring_start_time = None
+        self._monotonic_start: Optional[float] = None  # For elapsed time; wall clock only for timestamps
+        self._task_group: Optional[asyncio.TaskGroup] = None
+        self._tasks: List[asyncio.Task] = []
+        self._check_tasks: set = set()  # Check runs in flight, started by the scheduler
+        self.intervals: Dict[str, PollInterval] = {}
+        self._checks: Dict[str, Any] = {}
+        self._cache = TTLCache()
+        self._coverage_pool = ProcessPoolExecutor(max_workers=1)
+        self._issues_recorded = 0
+        self._record_counts = Counter()  # Totals per record kind; the deques only keep the latest
+        self._record_queue: asyncio.Queue = asyncio.Queue(maxsize=RECORD_QUEUE_SIZE)
+        self._records_dropped = 0
+        
+        # Prime the CPU counter so later non-blocking samples measure since the previous call
+        psutil.cpu_percent(interval=None)
+        self._last_sample_ts = 0.0
+        self._cached_sample = None
+        
+        # Incremental log tailing state: (byte offset, inode) and recent lines per file
+        self._log_offsets: Dict[Path, tuple] = {}
+        self._log_tails: Dict[Path, deque] = {}
+        self._log_mtimes: Dict[Path, float] = {}
         self.check_interval = 15  # 15 seconds
         self.health_thresholds = {
             'cpu_usage': 80.0,
@@ -74,6 +283,7 @@ class ComprehensiveMonitor:
         """Start comprehensive monitoring."""
         self.logger.info("🚀 Starting comprehensive monitoring...")
         self.monitoring_start_time = datetime.utcnow()
+        self._monotonic_start = time.monotonic()
         
         try:
             # Initialize services
@@ -99,33 +309,33 @@ class ComprehensiveMonitor:
             self.logger.info("🕷️ Initializing Scraper Manager...")
             scraper_manager = ScraperManager()
             await scraper_manager.__aenter__()
-            self.services['scraper_manager'] = scraper_manager
+            self._register_service('scraper_manager', scraper_manager)
             self.logger.info("✅ Scraper Manager initialized")
             
             # Initialize Data Pipeline
             self.logger.info("🔄 Initializing Data Pipeline...")
             data_pipeline = DataPipeline()
             await data_pipeline.__aenter__()
-            self.services['data_pipeline'] = data_pipeline
+            self._register_service('data_pipeline', data_pipeline)
             self.logger.info("✅ Data Pipeline initialized")
             
             # Initialize ETL Service
             self.logger.info("⚙️ Initializing ETL Service...")
             etl_service = ETLService()
             await etl_service.__aenter__()
-            self.services['etl_service'] = etl_service
+            self._register_service('etl_service', etl_service)
             self.logger.info("✅ ETL Service initialized")
             
             # Initialize Performance Monitor
             self.logger.info("📊 Initializing Performance Monitor...")
             performance_monitor = PerformanceMonitor()
-            self.services['performance_monitor'] = performance_monitor
+            self._register_service('performance_monitor', performance_monitor)
             self.logger.info("✅ Performance Monitor initialized")
             
             # Initialize Coverage Validator
             self.logger.info("📋 Initializing Coverage Validator...")
             coverage_validator = CoverageValidator()
-            self.services['coverage_validator'] = coverage_validator
+            self._register_service('coverage_validator', coverage_validator)
             self.logger.info("✅ Coverage Validator initialized")
             
             self.logger.info(f"✅ All {len(self.services)} services initialized")
@@ -135,121 +345,217 @@ class ComprehensiveMonitor:
             log_error(e, "ComprehensiveMonitor._initialize_services")
             raise
     
+    def _register_service(self, name: str, service: Any):
+        """Register a service and remember its async exit hook, if any, for shutdown."""
+        self.services[name] = service
+        aexit = getattr(service, '__aexit__', None)
+        if aexit is not None:
+            self._service_exits[name] = aexit
+    
+    async def _safe_aexit(self, service_name: str):
+        """Run one service's exit hook under its own deadline, logging rather than raising failures."""
+        try:
+            aexit = self._service_exits.get(service_name)
+            if aexit is not None:
+                await asyncio.wait_for(aexit(None, None, None), timeout=SERVICE_EXIT_TIMEOUT)
+            self.logger.info(f"✅ {service_name} shutdown completed")
+        except asyncio.TimeoutError:
+            self.logger.error(f"❌ {service_name} shutdown timed out after {SERVICE_EXIT_TIMEOUT}s")
+        except Exception as e:
+            self.logger.error(f"❌ {service_name} shutdown failed: {e}")
+    
+    async def _exit_services(self):
+        """Run the exit hooks of all registered services concurrently."""
+        await asyncio.gather(
+            *(self._safe_aexit(service_name) for service_name in self.services),
+            return_exceptions=True
+        )
+    
     async def _start_monitoring_tasks(self):
         """Start all monitoring tasks."""
         self.logger.info("📊 Starting monitoring tasks...")
         
         try:
-            # Start system resource monitoring
-            asyncio.create_task(self._monitor_system_resources())
-            self.logger.info("✅ System resource monitoring started")
-            
-            # Start service health monitoring
-            asyncio.create_task(self._monitor_service_health())
-            self.logger.info("✅ Service health monitoring started")
+            # Periodic checks and their base polling periods: every 15s, 30s, 1m, 45s, 90s and 2m
+            checks = (
+                ("system_resources", self._check_system_resources, 1),
+                ("service_health", self._check_service_health, 2),
+                ("performance", self._check_performance, 4),
+                ("error_detection", self._analyze_errors_and_bugs, 3),
+                ("log_analysis", self._perform_log_analysis, 6),
+                ("coverage", self._check_coverage, 8),
+            )
+            self._checks = {name: check for name, check, _ in checks}
+            self.intervals = {name: PollInterval(self.check_interval * factor) for name, _, factor in checks}
             
-            # Start performance monitoring
-            asyncio.create_task(self._monitor_performance())
-            self.logger.info("✅ Performance monitoring started")
+            monitors = (
+                ("scheduler", self._run_scheduler, f"✅ Monitoring scheduler started ({len(checks)} checks)"),
+                ("record_writer", self._drain_records, "✅ Record writer started"),
+            )
             
-            # Start error detection and analysis
-            asyncio.create_task(self._detect_errors_and_bugs())
-            self.logger.info("✅ Error detection started")
+            # Keep task handles in a task group so they can be cancelled and awaited on shutdown
+            self._task_group = asyncio.TaskGroup()
+            await self._task_group.__aenter__()
             
-            # Start log analysis
-            asyncio.create_task(self._analyze_logs())
-            self.logger.info("✅ Log analysis started")
-            
-            # Start coverage monitoring
-            asyncio.create_task(self._monitor_coverage())
-            self.logger.info("✅ Coverage monitoring started")
+            for name, monitor, message in monitors:
+                task = self._task_group.create_task(monitor(), name=name)
+                task.add_done_callback(self._on_task_done)
+                self._tasks.append(task)
+                self.logger.info(message)
             
         except Exception as e:
             self.logger.error(f"❌ Monitoring tasks startup failed: {e}")
             log_error(e, "ComprehensiveMonitor._start_monitoring_tasks")
     
-    async def _monitor_system_resources(self):
-        """Monitor system resources continuously."""
-        self.logger.info("💻 System resource monitoring active")
+    def _on_task_done(self, task: asyncio.Task):
+        """Surface failures of monitoring tasks that exited unexpectedly."""
+        if task.cancelled():
+            return
         
-        while not shutdown_event.is_set():
-            try:
-                await asyncio.sleep(self.check_interval)
-                await self._check_system_resources()
+        error = task.exception()
+        if error is not None:
+            self.logger.error(f"❌ Monitoring task {task.get_name()} failed: {error}")
+            self._record_error(f"monitoring_task.{task.get_name()}", error)
+    
+    async def _run_scheduler(self):
+        """Start each periodic check when it is due, taking the next due check from a min-heap.
+        
+        Every check runs as its own task so a slow one (the performance check sleeps, coverage
+        waits on the process pool) never delays the others. A check is put back on the heap only
+        when its run finishes, so it never overlaps itself.
+        """
+        loop = asyncio.get_running_loop()
+        task_group = self._task_group
+        sequence = itertools.count()
+        rescheduled = asyncio.Event()
+        
+        # Heap of (due time, tie-breaker, check name)
+        schedule = [(loop.time() + interval.cur, next(sequence), name) for name, interval in self.intervals.items()]
+        heapq.heapify(schedule)
+        
+        def reschedule(name: str):
+            heapq.heappush(schedule, (loop.time() + self.intervals[name].cur, next(sequence), name))
+            rescheduled.set()
+        
+        try:
+            while True:
+                # Sleep until the earliest check is due, a finished check is rescheduled, or shutdown
+                rescheduled.clear()
+                timeout = max(0.0, schedule[0][0] - loop.time()) if schedule else None
+                if await self._wait_for_schedule(rescheduled, timeout):
+                    break
                 
-            except asyncio.CancelledError:
-                self.logger.info("💻 System resource monitoring cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ System resource monitoring error: {e}")
-                log_error(e, "ComprehensiveMonitor._monitor_system_resources")
+                while schedule and schedule[0][0] <= loop.time():
+                    _, _, name = heapq.heappop(schedule)
+                    task = task_group.create_task(self._run_scheduled_check(name, reschedule), name=f"check.{name}")
+                    self._check_tasks.add(task)
+                    task.add_done_callback(self._check_tasks.discard)
+                
+        except asyncio.CancelledError:
+            self.logger.info("📊 Monitoring scheduler cancelled")
+        finally:
+            for task in self._check_tasks:
+                task.cancel()
+    
+    @staticmethod
+    async def _wait_for_schedule(rescheduled: asyncio.Event, timeout: Optional[float]) -> bool:
+        """Wait up to timeout seconds for the schedule to change; return True if shutdown was requested."""
+        waiters = [asyncio.ensure_future(shutdown_event.wait()), asyncio.ensure_future(rescheduled.wait())]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return shutdown_event.is_set()
+    
+    async def _run_scheduled_check(self, name: str, reschedule):
+        """Run one due check, logging its failures, then put it back on the schedule."""
+        try:
+            await self._run_check(name, self._checks[name])
+        except Exception as e:
+            self.logger.error(f"❌ {name} check failed: {e}")
+            log_error(e, f"ComprehensiveMonitor._run_scheduler.{name}")
+        reschedule(name)
+    
+    async def _run_check(self, name: str, check):
+        """Run a check and adapt its polling interval to whether it recorded any issues."""
+        issue_count = [0]
+        token = _check_issue_count.set(issue_count)
+        try:
+            await check()
+        finally:
+            _check_issue_count.reset(token)
+        self.intervals[name].update(healthy=issue_count[0] == 0)
+    
+    @staticmethod
+    def _sample_system():
+        """Sample CPU, memory, disk and network usage (blocking)."""
+        # CPU usage since the previous sample (non-blocking)
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        # Memory usage
+        memory = psutil.virtual_memory()
+        
+        # Disk usage
+        disk = psutil.disk_usage('/')
+        
+        # Network stats
+        network = psutil.net_io_counters()
+        
+        return cpu_percent, memory, disk, network
     
     async def _check_system_resources(self):
         """Check system resources and detect issues."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Reuse the last sample while it is younger than the check's current polling interval,
+            # otherwise sample in a worker thread
+            interval = self.intervals.get('system_resources')
+            sample_ttl = (interval.cur if interval is not None else self.check_interval) - 0.5
+            now = time.monotonic()
+            fresh = self._cached_sample is None or now - self._last_sample_ts >= sample_ttl
+            if fresh:
+                loop = asyncio.get_running_loop()
+                self._cached_sample = await loop.run_in_executor(None, self._sample_system)
+                self._last_sample_ts = now
+            cpu_percent, memory, disk, network = self._cached_sample
+            memory_percent = memory.percent
+            disk_percent = disk.percent
             
-            # Memory usage
-            memory = psutil.virtual_memory()
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            
-            # Network stats
-            network = psutil.net_io_counters()
-            
-            # Check thresholds and log issues
+            # Check thresholds and log issues; a reused sample was already judged when it was taken,
+            # so only fresh samples can record issues (and tighten the polling interval)
             issues = []
             
-            if cpu_percent > self.health_thresholds['cpu_usage']:
+            if fresh and cpu_percent > self.health_thresholds['cpu_usage']:
                 issues.append(f"High CPU usage: {cpu_percent}%")
                 self._record_performance_issue("high_cpu", cpu_percent, {"threshold": self.health_thresholds['cpu_usage']})
             
-            if memory.percent > self.health_thresholds['memory_usage']:
-                issues.append(f"High memory usage: {memory.percent}%")
-                self._record_performance_issue("high_memory", memory.percent, {"threshold": self.health_thresholds['memory_usage']})
-            
-            if (disk.used / disk.total) * 100 > self.health_thresholds['disk_usage']:
-                issues.append(f"High disk usage: {(disk.used / disk.total) * 100:.1f}%")
-                self._record_performance_issue("high_disk", (disk.used / disk.total) * 100, {"threshold": self.health_thresholds['disk_usage']})
-            
-            # Log system status
-            system_status = {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "disk_percent": (disk.used / disk.total) * 100,
-                "network_bytes_sent": network.bytes_sent,
-                "network_bytes_recv": network.bytes_recv,
-                "issues": issues
-            }
+            if fresh and memory_percent > self.health_thresholds['memory_usage']:
+                issues.append(f"High memory usage: {memory_percent}%")
+                self._record_performance_issue("high_memory", memory_percent, {"threshold": self.health_thresholds['memory_usage']})
+            
+            if fresh and disk_percent > self.health_thresholds['disk_usage']:
+                issues.append(f"High disk usage: {disk_percent:.1f}%")
+                self._record_performance_issue("high_disk", disk_percent, {"threshold": self.health_thresholds['disk_usage']})
             
             if issues:
                 self.logger.warning(f"⚠️ System resource issues detected: {', '.join(issues)}")
-                log_system_health("SystemResources", "degraded", system_status)
-            else:
-                log_system_health("SystemResources", "healthy", system_status)
+            
+            # Log system status (skip building the payload when health logging is off)
+            if health_logger.isEnabledFor(logging.INFO):
+                system_status = {
+                    "cpu_percent": cpu_percent,
+                    "memory_percent": memory_percent,
+                    "disk_percent": disk_percent,
+                    "network_bytes_sent": network.bytes_sent,
+                    "network_bytes_recv": network.bytes_recv,
+                    "issues": issues
+                }
+                log_system_health("SystemResources", "degraded" if issues else "healthy", system_status)
             
         except Exception as e:
             self.logger.error(f"❌ System resource check failed: {e}")
             log_error(e, "ComprehensiveMonitor._check_system_resources")
     
-    async def _monitor_service_health(self):
-        """Monitor health of all services."""
-        self.logger.info("🏥 Service health monitoring active")
-        
-        while not shutdown_event.is_set():
-            try:
-                await asyncio.sleep(self.check_interval * 2)  # Check every 30 seconds
-                await self._check_service_health()
-                
-            except asyncio.CancelledError:
-                self.logger.info("🏥 Service health monitoring cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ Service health monitoring error: {e}")
-                log_error(e, "ComprehensiveMonitor._monitor_service_health")
-    
     async def _check_service_health(self):
         """Check health of all services."""
         try:
@@ -258,7 +564,7 @@ class ComprehensiveMonitor:
             # Check Scraper Manager
             if 'scraper_manager' in self.services:
                 try:
-                    status = self.services['scraper_manager'].get_system_status()
+                    status = self._get_scraper_status()
                     health_results['scraper_manager'] = {
                         'status': status['health_status'],
                         'active_jobs': status['active_jobs_count'],
@@ -283,7 +589,7 @@ class ComprehensiveMonitor:
             # Check Coverage Validator
             if 'coverage_validator' in self.services:
                 try:
-                    coverage_data = self.services['coverage_validator'].measure_coverage('src')
+                    coverage_data = await self._get_coverage()
                     health_results['coverage_validator'] = {
                         'status': 'healthy',
                         'coverage': coverage_data.get('coverage_percentage', 0)
@@ -303,33 +609,18 @@ class ComprehensiveMonitor:
             else:
                 overall_status = "unhealthy"
             
-            log_system_health("AllServices", overall_status, {
-                "overall_status": overall_status,
-                "healthy_services": healthy_services,
-                "total_services": total_services,
-                "services": health_results
-            })
+            if health_logger.isEnabledFor(logging.INFO):
+                log_system_health("AllServices", overall_status, {
+                    "overall_status": overall_status,
+                    "healthy_services": healthy_services,
+                    "total_services": total_services,
+                    "services": health_results
+                })
             
         except Exception as e:
             self.logger.error(f"❌ Service health check failed: {e}")
             log_error(e, "ComprehensiveMonitor._check_service_health")
     
-    async def _monitor_performance(self):
-        """Monitor performance metrics."""
-        self.logger.info("⚡ Performance monitoring active")
-        
-        while not shutdown_event.is_set():
-            try:
-                await asyncio.sleep(self.check_interval * 4)  # Check every minute
-                await self._check_performance()
-                
-            except asyncio.CancelledError:
-                self.logger.info("⚡ Performance monitoring cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ Performance monitoring error: {e}")
-                log_error(e, "ComprehensiveMonitor._monitor_performance")
-    
     async def _check_performance(self):
         """Check performance metrics."""
         try:
@@ -359,22 +650,6 @@ class ComprehensiveMonitor:
             self.logger.error(f"❌ Performance check failed: {e}")
             log_error(e, "ComprehensiveMonitor._check_performance")
     
-    async def _detect_errors_and_bugs(self):
-        """Detect and analyze errors and bugs."""
-        self.logger.info("🐛 Error detection and bug analysis active")
-        
-        while not shutdown_event.is_set():
-            try:
-                await asyncio.sleep(self.check_interval * 3)  # Check every 45 seconds
-                await self._analyze_errors_and_bugs()
-                
-            except asyncio.CancelledError:
-                self.logger.info("🐛 Error detection cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ Error detection failed: {e}")
-                log_error(e, "ComprehensiveMonitor._detect_errors_and_bugs")
-    
     async def _analyze_errors_and_bugs(self):
         """Analyze errors and bugs."""
         try:
@@ -396,28 +671,20 @@ class ComprehensiveMonitor:
         try:
             # Check if error log file exists and has recent entries
             error_log_file = Path("logs/errors.log")
-            if error_log_file.exists():
+            try:
+                stat = error_log_file.stat()
+            except FileNotFoundError:
+                stat = None
+            
+            if stat is not None:
                 # Read recent error log entries
-                with open(error_log_file, 'r') as f:
-                    lines = f.readlines()
-                    recent_errors = lines[-50:] if len(lines) > 50 else lines
+                recent_errors = list(self._tail_log(error_log_file, stat))[-50:]
                 
                 # Analyze error patterns
-                error_patterns = {}
-                for line in recent_errors:
-                    if 'ERROR' in line:
-                        # Extract error type and message
-                        if 'ImportError' in line:
-                            error_patterns['ImportError'] = error_patterns.get('ImportError', 0) + 1
-                        elif 'AttributeError' in line:
-                            error_patterns['AttributeError'] = error_patterns.get('AttributeError', 0) + 1
-                        elif 'ConnectionError' in line:
-                            error_patterns['ConnectionError'] = error_patterns.get('ConnectionError', 0) + 1
-                        elif 'TimeoutError' in line:
-                            error_patterns['TimeoutError'] = error_patterns.get('TimeoutError', 0) + 1
+                error_patterns = Counter(ERROR_TYPE_PATTERN.findall("\n".join(recent_errors)))
                 
                 # Report error patterns
-                for error_type, count in error_patterns.items():
+                for error_type, count in error_patterns.most_common(10):
                     if count > 3:  # Threshold for reporting
                         self._record_bug("frequent_errors", {
                             "error_type": error_type,
@@ -451,7 +718,7 @@ class ComprehensiveMonitor:
             if 'coverage_validator' in self.services:
                 try:
                     # Test coverage measurement
-                    coverage_data = self.services['coverage_validator'].measure_coverage('src')
+                    coverage_data = await self._get_coverage()
                     if not coverage_data or coverage_data.get('coverage_percentage', 0) == 0:
                         self._record_bug("coverage_measurement_failed", {
                             "service": "coverage_validator",
@@ -472,7 +739,7 @@ class ComprehensiveMonitor:
             # Check for data consistency issues
             if 'scraper_manager' in self.services:
                 try:
-                    status = self.services['scraper_manager'].get_system_status()
+                    status = self._get_scraper_status()
                     
                     # Check for inconsistencies
                     if status.get('active_jobs_count', 0) < 0:
@@ -498,65 +765,46 @@ class ComprehensiveMonitor:
             self.logger.error(f"❌ Data consistency check failed: {e}")
             log_error(e, "ComprehensiveMonitor._check_data_inconsistencies")
     
-    async def _analyze_logs(self):
-        """Analyze log files for patterns and issues."""
-        self.logger.info("📋 Log analysis active")
-        
-        while not shutdown_event.is_set():
-            try:
-                await asyncio.sleep(self.check_interval * 6)  # Check every 90 seconds
-                await self._perform_log_analysis()
-                
-            except asyncio.CancelledError:
-                self.logger.info("📋 Log analysis cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ Log analysis failed: {e}")
-                log_error(e, "ComprehensiveMonitor._analyze_log_analysis")
-    
     async def _perform_log_analysis(self):
         """Perform comprehensive log analysis."""
         try:
-            logs_dir = Path("logs")
-            if not logs_dir.exists():
+            # One directory scan; DirEntry caches the stat result for each file
+            try:
+                with os.scandir("logs") as it:
+                    entries = [e for e in it if e.name.endswith(".log") and e.is_file()]
+            except FileNotFoundError:
                 return
             
             # Analyze different log files
-            for log_file in logs_dir.glob("*.log"):
-                await self._analyze_single_log(log_file)
+            for entry in entries:
+                await self._analyze_single_log(Path(entry.path), entry.stat())
                 
         except Exception as e:
             self.logger.error(f"❌ Log analysis failed: {e}")
             log_error(e, "ComprehensiveMonitor._perform_log_analysis")
     
-    async def _analyze_single_log(self, log_file: Path):
+    async def _analyze_single_log(self, log_file: Path, stat: Optional[os.stat_result] = None):
         """Analyze a single log file."""
         try:
-            if not log_file.exists():
+            if stat is None:
+                try:
+                    stat = log_file.stat()
+                except FileNotFoundError:
+                    return
+            
+            # Nothing new to analyze if the file hasn't been written since the last pass
+            if self._log_mtimes.get(log_file) == stat.st_mtime:
                 return
+            self._log_mtimes[log_file] = stat.st_mtime
             
             # Read recent log entries
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                recent_lines = lines[-100:] if len(lines) > 100 else lines
-            
-            # Analyze patterns
-            patterns = {
-                'errors': 0,
-                'warnings': 0,
-                'critical': 0,
-                'exceptions': 0
-            }
+            recent_lines = self._tail_log(log_file, stat)
             
-            for line in recent_lines:
-                if 'ERROR' in line:
-                    patterns['errors'] += 1
-                elif 'WARNING' in line:
-                    patterns['warnings'] += 1
-                elif 'CRITICAL' in line:
-                    patterns['critical'] += 1
-                elif 'Exception' in line or 'Traceback' in line:
-                    patterns['exceptions'] += 1
+            # Classify every line by its first keyword (normally the log level) in one scan
+            patterns = Counter(
+                LOG_LEVEL_CATEGORIES[keyword]
+                for keyword in LOG_LEVEL_PATTERN.findall("\n".join(recent_lines))
+            )
             
             # Report concerning patterns
             if patterns['errors'] > 10:
@@ -579,27 +827,46 @@ class ComprehensiveMonitor:
             self.logger.error(f"❌ Single log analysis failed for {log_file}: {e}")
             log_error(e, "ComprehensiveMonitor._analyze_single_log")
     
-    async def _monitor_coverage(self):
-        """Monitor code coverage."""
-        self.logger.info("📊 Coverage monitoring active")
+    def _tail_log(self, log_file: Path, stat: Optional[os.stat_result] = None) -> deque:
+        """Return the last LOG_TAIL_LINES lines of a log file, reading only newly appended bytes."""
+        if stat is None:
+            stat = log_file.stat()
+        offset, inode = self._log_offsets.get(log_file, (0, stat.st_ino))
+        tail = self._log_tails.setdefault(log_file, deque(maxlen=LOG_TAIL_LINES))
         
-        while not shutdown_event.is_set():
-            try:
-                await asyncio.sleep(self.check_interval * 8)  # Check every 2 minutes
-                await self._check_coverage()
-                
-            except asyncio.CancelledError:
-                self.logger.info("📊 Coverage monitoring cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ Coverage monitoring failed: {e}")
-                log_error(e, "ComprehensiveMonitor._monitor_coverage")
+        # Start over if the file was rotated or truncated
+        if inode != stat.st_ino or stat.st_size < offset:
+            offset = 0
+            tail.clear()
+        
+        with open(log_file, 'rb') as f:
+            if offset == 0 and stat.st_size > 0:
+                # First read: walk back from the end for the last LOG_TAIL_LINES lines
+                # instead of decoding the whole file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = end = mm.rfind(b'\n') + 1
+                    for _ in range(LOG_TAIL_LINES):
+                        if start == 0:
+                            break
+                        start = mm.rfind(b'\n', 0, start - 1) + 1
+                    data = mm[start:end]
+                offset = start
+            else:
+                f.seek(offset)
+                data = f.read()
+        
+        # Only consume complete lines; a partial last line is picked up next time
+        end = data.rfind(b'\n') + 1
+        tail.extend(data[:end].decode('utf-8', errors='replace').splitlines())
+        self._log_offsets[log_file] = (offset + end, stat.st_ino)
+        
+        return tail
     
     async def _check_coverage(self):
         """Check code coverage."""
         try:
             if 'coverage_validator' in self.services:
-                coverage_data = self.services['coverage_validator'].measure_coverage('src')
+                coverage_data = await self._get_coverage()
                 
                 if coverage_data:
                     coverage_percentage = coverage_data.get('coverage_percentage', 0)
@@ -625,35 +892,63 @@ class ComprehensiveMonitor:
             self.logger.error(f"❌ Coverage check failed: {e}")
             log_error(e, "ComprehensiveMonitor._check_coverage")
     
+    def _get_scraper_status(self) -> Dict[str, Any]:
+        """Get the scraper manager status, shared across checks within one interval."""
+        return self._cache.get_or_call(
+            'scraper_status',
+            self.services['scraper_manager'].get_system_status,
+            ttl=self.check_interval
+        )
+    
+    async def _get_coverage(self) -> Dict[str, Any]:
+        """Get coverage data, shared across checks for a few intervals since it is expensive."""
+        return await self._cache.get_or_await(
+            'coverage',
+            self._measure_coverage,
+            ttl=self.check_interval * 4
+        )
+    
+    async def _measure_coverage(self) -> Dict[str, Any]:
+        """Measure coverage in a worker process so the event loop is never starved."""
+        loop = asyncio.get_running_loop()
+        coverage_data = await loop.run_in_executor(self._coverage_pool, measure_coverage_worker, 'src')
+        
+        # Keep the local validator in sync for gap analysis
+        self.services['coverage_validator'].coverage_data = coverage_data
+        return coverage_data
+    
     def _record_error(self, context: str, error: Exception):
         """Record an error for analysis."""
         error_record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "context": context,
             "error_type": type(error).__name__,
             "error_message": str(error),
-            "traceback": traceback.format_exc()
+            # Cheap snapshot that doesn't keep frames alive; formatted only on export
+            "traceback": traceback.TracebackException.from_exception(error, lookup_lines=False)
         }
         
         error_logs.append(error_record)
-        self.logger.error(f"🚨 Error recorded: {context} - {type(error).__name__}: {str(error)}")
+        self._count_issue()
+        self._enqueue_record("error", error_record)
     
     def _record_bug(self, bug_type: str, details: Dict[str, Any]):
         """Record a bug for analysis."""
         bug_report = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "bug_type": bug_type,
             "details": details,
             "severity": self._assess_bug_severity(bug_type, details)
         }
         
         bug_reports.append(bug_report)
-        self.logger.warning(f"🐛 Bug detected: {bug_type} - {details}")
+        self._count_issue()
+        self._enqueue_record("bug", bug_report)
     
     def _record_performance_issue(self, issue_type: str, value: float, context: Dict[str, Any]):
         """Record a performance issue."""
         performance_issue = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "issue_type": issue_type,
             "value": value,
             "context": context,
@@ -661,7 +956,56 @@ class ComprehensiveMonitor:
         }
         
         performance_issues.append(performance_issue)
-        self.logger.warning(f"⚡ Performance issue: {issue_type} - {value}")
+        self._count_issue()
+        self._enqueue_record("performance_issue", performance_issue)
+    
+    def _count_issue(self):
+        """Count a recorded issue in the monitor total and against the check currently running."""
+        self._issues_recorded += 1
+        issue_count = _check_issue_count.get()
+        if issue_count is not None:
+            issue_count[0] += 1
+    
+    def _enqueue_record(self, kind: str, record: Dict[str, Any]):
+        """Queue a record for the writer task, dropping it if the queue is full."""
+        self._record_counts[kind] += 1
+        try:
+            self._record_queue.put_nowait((kind, record))
+        except asyncio.QueueFull:
+            self._records_dropped += 1
+    
+    async def _drain_records(self):
+        """Single consumer that writes queued records to disk as they arrive."""
+        while True:
+            try:
+                record = await self._record_queue.get()
+                await self._flush_records([record])
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"❌ Record writing failed: {e}")
+                log_error(e, "ComprehensiveMonitor._drain_records")
+    
+    async def _flush_records(self, batch: Optional[List[tuple]] = None):
+        """Write queued records to RECORDS_LOG_FILE in a worker thread, one writev call per batch."""
+        loop = asyncio.get_running_loop()
+        batch = batch or []
+        
+        while True:
+            while len(batch) < RECORD_FLUSH_BATCH and not self._record_queue.empty():
+                batch.append(self._record_queue.get_nowait())
+            if not batch:
+                return
+            
+            await loop.run_in_executor(None, write_records_batch, RECORDS_LOG_FILE, batch)
+            
+            counts = Counter(kind for kind, _ in batch)
+            self.logger.warning(
+                f"📝 Recorded {counts['bug']} bugs, {counts['error']} errors and "
+                f"{counts['performance_issue']} performance issues ({RECORDS_LOG_FILE})"
+            )
+            batch = []
     
     def _assess_bug_severity(self, bug_type: str, details: Dict[str, Any]) -> str:
         """Assess the severity of a bug."""
@@ -705,94 +1049,108 @@ class ComprehensiveMonitor:
         self.logger.info("🛑 Shutting down monitoring...")
         
         try:
-            # Shutdown services
-            for service_name, service in self.services.items():
+            # Stop monitoring tasks
+            if self._task_group is not None:
+                task_group, self._task_group = self._task_group, None
+                for task in (*self._tasks, *self._check_tasks):
+                    task.cancel()
                 try:
-                    if hasattr(service, '__aexit__'):
-                        await service.__aexit__(None, None, None)
-                    self.logger.info(f"✅ {service_name} shutdown completed")
+                    await task_group.__aexit__(None, None, None)
                 except Exception as e:
-                    self.logger.error(f"❌ {service_name} shutdown failed: {e}")
+                    self.logger.error(f"❌ Monitoring tasks shutdown failed: {e}")
+                self._tasks.clear()
+            
+            # Write out any records recorded since the last flush
+            await self._flush_records()
+            
+            # Stop the coverage worker process
+            self._coverage_pool.shutdown(wait=False, cancel_futures=True)
+            
+            # Shutdown services, but never let a hung service block the final report
+            try:
+                await asyncio.wait_for(self._exit_services(), timeout=SERVICE_SHUTDOWN_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.error(f"❌ Service shutdown timed out after {SERVICE_SHUTDOWN_TIMEOUT}s")
             
             # Generate final report
             await self._generate_final_report()
             
         except Exception as e:
-            self.logger.error(f"❌ Monitoring shutdown failed: {e}")
-            log_error(e, "ComprehensiveMonitor._shutdown_monitoring")
+            self.logger.error(f"❌ Monitoring shutdown failed: {e}", exc_info=True)
     
     async def _generate_final_report(self):
         """Generate final monitoring and bug report."""
         self.logger.info("📋 Generating final monitoring report...")
         
         try:
+            # One timestamp for the whole report
+            now = datetime.utcnow()
+            
             # Calculate monitoring duration
-            if self.monitoring_start_time:
-                duration = (datetime.utcnow() - self.monitoring_start_time).total_seconds()
+            if self._monotonic_start is not None:
+                duration = time.monotonic() - self._monotonic_start
             else:
                 duration = 0
             
+            # Read the totals once for both the report and the summary
+            counts = self._record_counts
+            n_bugs, n_errors, n_perf = counts["bug"], counts["error"], counts["performance_issue"]
+            
             # Generate comprehensive report
+            # Record sections are streamed element by element rather than materialized;
+            # the write below is synchronous, so no task can append to them mid-report
             report = {
                 "monitoring_session": {
-                    "start_time": self.monitoring_start_time.isoformat() if self.monitoring_start_time else None,
-                    "end_time": datetime.utcnow().isoformat(),
+                    "start_time": self.monitoring_start_time,
+                    "end_time": now,
                     "duration_seconds": duration,
                     "check_interval": self.check_interval
                 },
                 "issues_detected": {
-                    "total_bugs": len(bug_reports),
-                    "total_errors": len(error_logs),
-                    "total_performance_issues": len(performance_issues)
+                    "total_bugs": n_bugs,
+                    "total_errors": n_errors,
+                    "total_performance_issues": n_perf,
+                    "records_dropped": self._records_dropped
                 },
                 "bug_reports": bug_reports,
-                "error_logs": error_logs[-20:],  # Last 20 errors
+                "error_logs": map(export_record, error_logs),  # Last ERROR_LOG_TAIL errors
                 "performance_issues": performance_issues,
                 "recommendations": self._generate_recommendations()
             }
             
             # Save report to file
-            report_file = f"comprehensive_monitoring_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            report_file = f"comprehensive_monitoring_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
+            write_report_stream(report_file, report, pretty=REPORT_PRETTY)
             
             self.logger.info(f"📋 Final report saved to: {report_file}")
             
-            # Print summary
-            print("\n" + "=" * 80)
-            print("🔍 COMPREHENSIVE MONITORING REPORT")
-            print("=" * 80)
-            print(f"📅 Monitoring Duration: {duration:.2f} seconds")
-            print(f"🐛 Bugs Detected: {len(bug_reports)}")
-            print(f"🚨 Errors Logged: {len(error_logs)}")
-            print(f"⚡ Performance Issues: {len(performance_issues)}")
-            print(f"📋 Detailed Report: {report_file}")
-            print("=" * 80)
+            # Print summary in a single write
+            sys.stdout.write("\n".join([
+                "",
+                BANNER80,
+                "🔍 COMPREHENSIVE MONITORING REPORT",
+                BANNER80,
+                f"📅 Monitoring Duration: {duration:.2f} seconds",
+                f"🐛 Bugs Detected: {n_bugs}",
+                f"🚨 Errors Logged: {n_errors}",
+                f"⚡ Performance Issues: {n_perf}",
+                f"📋 Detailed Report: {report_file}",
+                BANNER80,
+                ""
+            ]))
             
         except Exception as e:
-            self.logger.error(f"❌ Final report generation failed: {e}")
-            log_error(e, "ComprehensiveMonitor._generate_final_report")
+            self.logger.error(f"❌ Final report generation failed: {e}", exc_info=True)
     
     def _generate_recommendations(self) -> List[str]:
         """Generate recommendations based on detected issues."""
-        recommendations = []
-        
-        # Analyze bug patterns
-        bug_types = [bug['bug_type'] for bug in bug_reports]
-        
-        if 'frequent_exceptions' in bug_types:
-            recommendations.append("Review error handling and add more robust exception management")
-        
-        if 'high_error_rate' in bug_types:
-            recommendations.append("Investigate root causes of frequent errors and implement fixes")
-        
-        if 'low_coverage' in bug_types:
-            recommendations.append("Increase test coverage by adding more unit and integration tests")
+        # Analyze bug patterns (one pass each, O(1) membership checks)
+        bug_types = {bug['bug_type'] for bug in bug_reports}
+        perf_types = {issue['issue_type'] for issue in performance_issues}
         
-        if 'data_inconsistency' in bug_types:
-            recommendations.append("Review data validation and consistency checks")
+        recommendations = [message for bug_type, message in BUG_RECOMMENDATIONS if bug_type in bug_types]
         
-        if 'performance_issues' in [issue['issue_type'] for issue in performance_issues]:
+        if 'performance_issues' in perf_types:
             recommendations.append("Optimize performance bottlenecks and resource usage")
         
         if not recommendations:
@@ -803,11 +1161,11 @@ class ComprehensiveMonitor:
 
 async def main():
     """Main monitoring function."""
-    global startup_time
     startup_time = datetime.utcnow()
+    started = time.monotonic()
     
     print("🔍 OpenPolicy Scraper Service - Comprehensive Monitoring & Bug Detection")
-    print("=" * 80)
+    print(BANNER80)
     print(f"📅 Monitoring started: {startup_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("🔧 Enhanced logging and comprehensive monitoring enabled")
     print("🐛 Bug detection and error analysis active")
@@ -829,9 +1187,8 @@ async def main():
         sys.exit(1)
     finally:
         print(f"\n📊 Monitoring completed at: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}")
-        if startup_time:
-            uptime = (datetime.utcnow() - startup_time).total_seconds()
-            print(f"⏱️ Total monitoring time: {uptime:.2f} seconds")
+        uptime = time.monotonic() - started
+        print(f"⏱️ Total monitoring time: {uptime:.2f} seconds")
 
 
 if __name__ == "__main__":
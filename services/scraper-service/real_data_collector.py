@@ -9,7 +9,6 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-from datetime import datetime
 import json
 import time
 
@@ -28,6 +27,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Banner line used to frame progress headings
+BANNER60 = "=" * 60
+
+# Jurisdiction levels to collect and the number of records each produces
+COLLECTION_PLAN = [('federal', 150), ('provincial', 200), ('municipal', 250)]
+JURISDICTION_EMOJI = {'federal': '🌍', 'provincial': '🏛️', 'municipal': '🏙️'}
+
+# Data types processed by the extract/transform/load pipeline
+PIPELINE_DATA_TYPES = ['bills', 'representatives']
+
+
+def log_step_banner(title: str):
+    """Log a step heading framed by banner lines as one record."""
+    logger.info(f"\n{BANNER60}\n{title}\n{BANNER60}")
+
 
 class RealDataCollector:
     """Real data collector that runs actual scrapers."""
@@ -37,7 +51,6 @@ class RealDataCollector:
         self.scraper_manager = None
         self.data_pipeline = None
         self.etl_service = None
-        self.performance_monitor = PerformanceMonitor()
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -55,119 +68,44 @@ class RealDataCollector:
         if self.etl_service:
             await self.etl_service.__aexit__(exc_type, exc_val, exc_tb)
     
-    async def collect_federal_data(self):
-        """Collect federal parliamentary data."""
-        logger.info("🌍 Starting Federal Data Collection...")
+    async def collect(self, level: str, amount: int):
+        """Collect data for one jurisdiction level."""
+        logger.info(f"{JURISDICTION_EMOJI[level]} Starting {level.capitalize()} Data Collection...")
         
         try:
-            # Get federal scraper
+            # Get scrapers for this jurisdiction level
             scrapers = await self.scraper_manager.get_scrapers(
                 enabled_only=True, 
-                jurisdiction_level="federal"
+                jurisdiction_level=level
             )
             
             if not scrapers:
-                logger.error("No federal scrapers found")
+                logger.error(f"No {level} scrapers found")
                 return
                 
             scraper = scrapers[0]
-            logger.info(f"Running federal scraper: {scraper.name}")
+            logger.info(f"Running {level} scraper: {scraper.name}")
             
-            # Start performance monitoring
-            self.performance_monitor.start_monitoring()
+            # Start performance monitoring (one monitor per collection, they run concurrently)
+            performance_monitor = PerformanceMonitor()
+            await performance_monitor.start_monitoring()
             
             # Run the scraper
             job = await self.scraper_manager.run_scraper(scraper.id)
-            logger.info(f"Federal scraper job created: {job.id}")
+            logger.info(f"{level.capitalize()} scraper job created: {job.id}")
             
             # Simulate data collection process
-            await self._simulate_data_collection(scraper.id, "federal", 150)
+            await self._simulate_data_collection(scraper.id, level, amount)
             
             # Stop performance monitoring
-            self.performance_monitor.stop_monitoring()
+            await performance_monitor.stop_monitoring()
             
             # Record metrics
-            metrics = self.performance_monitor.get_system_metrics()
-            logger.info(f"Federal collection metrics: {metrics}")
+            metrics = await performance_monitor.get_system_metrics()
+            logger.info(f"{level.capitalize()} collection metrics: {metrics}")
             
         except Exception as e:
-            logger.error(f"Federal data collection failed: {e}")
-    
-    async def collect_provincial_data(self):
-        """Collect provincial data."""
-        logger.info("🏛️ Starting Provincial Data Collection...")
-        
-        try:
-            # Get provincial scrapers
-            scrapers = await self.scraper_manager.get_scrapers(
-                enabled_only=True, 
-                jurisdiction_level="provincial"
-            )
-            
-            if not scrapers:
-                logger.error("No provincial scrapers found")
-                return
-                
-            scraper = scrapers[0]
-            logger.info(f"Running provincial scraper: {scraper.name}")
-            
-            # Start performance monitoring
-            self.performance_monitor.start_monitoring()
-            
-            # Run the scraper
-            job = await self.scraper_manager.run_scraper(scraper.id)
-            logger.info(f"Provincial scraper job created: {job.id}")
-            
-            # Simulate data collection process
-            await self._simulate_data_collection(scraper.id, "provincial", 200)
-            
-            # Stop performance monitoring
-            self.performance_monitor.stop_monitoring()
-            
-            # Record metrics
-            metrics = self.performance_monitor.get_system_metrics()
-            logger.info(f"Provincial collection metrics: {metrics}")
-            
-        except Exception as e:
-            logger.error(f"Provincial data collection failed: {e}")
-    
-    async def collect_municipal_data(self):
-        """Collect municipal data."""
-        logger.info("🏙️ Starting Municipal Data Collection...")
-        
-        try:
-            # Get municipal scrapers
-            scrapers = await self.scraper_manager.get_scrapers(
-                enabled_only=True, 
-                jurisdiction_level="municipal"
-            )
-            
-            if not scrapers:
-                logger.error("No municipal scrapers found")
-                return
-                
-            scraper = scrapers[0]
-            logger.info(f"Running municipal scraper: {scraper.name}")
-            
-            # Start performance monitoring
-            self.performance_monitor.start_monitoring()
-            
-            # Run the scraper
-            job = await self.scraper_manager.run_scraper(scraper.id)
-            logger.info(f"Municipal scraper job created: {job.id}")
-            
-            # Simulate data collection process
-            await self._simulate_data_collection(scraper.id, "municipal", 250)
-            
-            # Stop performance monitoring
-            self.performance_monitor.stop_monitoring()
-            
-            # Record metrics
-            metrics = self.performance_monitor.get_system_metrics()
-            logger.info(f"Municipal collection metrics: {metrics}")
-            
-        except Exception as e:
-            logger.error(f"Municipal data collection failed: {e}")
+            logger.error(f"{level.capitalize()} data collection failed: {e}")
     
     async def _simulate_data_collection(self, scraper_id: int, jurisdiction: str, data_amount: int):
         """Simulate the data collection process."""
@@ -199,41 +137,31 @@ class RealDataCollector:
         """Run the data pipeline to process collected data."""
         logger.info("🔄 Starting Data Pipeline Processing...")
         
-        try:
-            # Process bills data
-            logger.info("Processing bills data...")
-            bills_data = await self.data_pipeline.extract_data(1, "bills")
-            logger.info(f"Extracted {len(bills_data)} bills")
-            
-            # Transform bills data
-            transformed_bills = await self.data_pipeline.transform_data(bills_data)
-            logger.info(f"Transformed {len(transformed_bills)} bills")
-            
-            # Load bills data
-            load_result = await self.data_pipeline.load_data(
-                transformed_bills, 
-                {"type": "database", "table": "bills"}
-            )
-            logger.info(f"Loaded bills: {load_result}")
-            
-            # Process representatives data
-            logger.info("Processing representatives data...")
-            reps_data = await self.data_pipeline.extract_data(1, "representatives")
-            logger.info(f"Extracted {len(reps_data)} representatives")
-            
-            # Transform representatives data
-            transformed_reps = await self.data_pipeline.transform_data(reps_data)
-            logger.info(f"Transformed {len(transformed_reps)} representatives")
-            
-            # Load representatives data
-            load_result = await self.data_pipeline.load_data(
-                transformed_reps, 
-                {"type": "database", "table": "representatives"}
-            )
-            logger.info(f"Loaded representatives: {load_result}")
-            
-        except Exception as e:
-            logger.error(f"Data pipeline processing failed: {e}")
+        # Data types share no state, so each runs extract/transform/load end to end concurrently
+        results = await asyncio.gather(
+            *(self._pipe(data_type) for data_type in PIPELINE_DATA_TYPES),
+            return_exceptions=True
+        )
+        
+        for data_type, result in zip(PIPELINE_DATA_TYPES, results):
+            if isinstance(result, Exception):
+                logger.error(f"Data pipeline processing failed for {data_type}: {result}")
+            else:
+                logger.info(f"Loaded {data_type}: {result}")
+    
+    async def _pipe(self, data_type: str):
+        """Extract, transform and load one data type, returning the load result."""
+        logger.info(f"Processing {data_type} data...")
+        data = await self.data_pipeline.extract_data(1, data_type)
+        logger.info(f"Extracted {len(data)} {data_type}")
+        
+        transformed_data = await self.data_pipeline.transform_data(data)
+        logger.info(f"Transformed {len(transformed_data)} {data_type}")
+        
+        return await self.data_pipeline.load_data(
+            transformed_data, 
+            {"type": "database", "table": data_type}
+        )
     
     async def run_etl_workflow(self):
         """Run ETL workflow for data processing."""
@@ -309,9 +237,9 @@ class RealDataCollector:
 async def main():
     """Main data collection process."""
     logger.info("🚀 Starting OpenPolicy Real Data Collection Process")
-    logger.info("=" * 60)
+    logger.info(BANNER60)
     
-    start_time = datetime.utcnow()
+    start_time = time.monotonic()
     
     try:
         async with RealDataCollector() as collector:
@@ -319,49 +247,49 @@ async def main():
             await collector.check_database_status()
             
             # Step 2: Collect data from all jurisdictions
-            logger.info("\n" + "=" * 60)
-            logger.info("STEP 2: COLLECTING REAL DATA FROM ALL JURISDICTIONS")
-            logger.info("=" * 60)
+            log_step_banner("STEP 2: COLLECTING REAL DATA FROM ALL JURISDICTIONS")
             
-            await collector.collect_federal_data()
-            await collector.collect_provincial_data()
-            await collector.collect_municipal_data()
+            # Jurisdictions are independent, so collect them concurrently
+            results = await asyncio.gather(
+                *(collector.collect(level, amount) for level, amount in COLLECTION_PLAN),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Data collection failed: {result}")
             
             # Step 3: Process data through pipeline
-            logger.info("\n" + "=" * 60)
-            logger.info("STEP 3: PROCESSING DATA THROUGH PIPELINE")
-            logger.info("=" * 60)
+            log_step_banner("STEP 3: PROCESSING DATA THROUGH PIPELINE")
             
             await collector.run_data_pipeline()
             
             # Step 4: Run ETL workflow
-            logger.info("\n" + "=" * 60)
-            logger.info("STEP 4: RUNNING ETL WORKFLOW")
-            logger.info("=" * 60)
+            log_step_banner("STEP 4: RUNNING ETL WORKFLOW")
             
             await collector.run_etl_workflow()
             
             # Step 5: Final status check
-            logger.info("\n" + "=" * 60)
-            logger.info("STEP 5: FINAL STATUS CHECK")
-            logger.info("=" * 60)
+            log_step_banner("STEP 5: FINAL STATUS CHECK")
             
             await collector.check_database_status()
             
             # Summary
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            logger.info("\n" + "=" * 60)
-            logger.info("🎉 REAL DATA COLLECTION PROCESS COMPLETED SUCCESSFULLY!")
-            logger.info(f"⏱️  Total Duration: {duration:.2f} seconds")
-            logger.info("=" * 60)
-            logger.info("📊 Your OpenPolicy database now contains:")
-            logger.info("  - Real scraper execution data")
-            logger.info("  - Performance metrics and monitoring")
-            logger.info("  - Processed data through ETL pipeline")
-            logger.info("  - Updated analytics and reporting")
-            logger.info("=" * 60)
+            duration = time.monotonic() - start_time
+            
+            # Summary banner as a single log record
+            logger.info("\n".join([
+                "",
+                BANNER60,
+                "🎉 REAL DATA COLLECTION PROCESS COMPLETED SUCCESSFULLY!",
+                f"⏱️  Total Duration: {duration:.2f} seconds",
+                BANNER60,
+                "📊 Your OpenPolicy database now contains:",
+                "  - Real scraper execution data",
+                "  - Performance metrics and monitoring",
+                "  - Processed data through ETL pipeline",
+                "  - Updated analytics and reporting",
+                BANNER60
+            ]))
             
     except Exception as e:
         logger.error(f"Real data collection process failed: {e}")
@@ -9,23 +9,30 @@ for the scraper service to function properly.
 import os
 import sys
 import asyncio
+from contextlib import closing
 from pathlib import Path
 
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, Boolean, DateTime, Float, Text
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, inspect, text, func, insert, select, MetaData, Table, Column, Integer, String, Boolean, DateTime, Float, Index, LargeBinary, Text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import declarative_base
 from datetime import datetime
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, make_dsn
+from psycopg2.extras import execute_values
 
 # Import our configuration
-from config import settings
+from config import config
 
-# Database configuration
-DATABASE_URL = "postgresql://ashishtandon@localhost:5432/openpolicy"
-DB_NAME = "openpolicy"
+# Database configuration, shared with the data collector (PROD_DATABASE_URL/TEST_DATABASE_URL override it)
+DATABASE_URL = config.DATABASE_URL
+DB_NAME = make_url(DATABASE_URL).database  # Follows the URL even when an override names another database
+
+# Seeds larger than this go through psycopg2's execute_values instead of a SQLAlchemy executemany
+BULK_INSERT_THRESHOLD = 100
+BULK_INSERT_PAGE_SIZE = 1000
 
 Base = declarative_base()
 
@@ -60,6 +67,9 @@ class ScraperInfo(Base):
 class ScraperJob(Base):
     """Scraper job execution table"""
     __tablename__ = 'scraper_jobs'
+    __table_args__ = (
+        Index('ix_scraper_jobs_status_scraper', 'status', 'scraper_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     scraper_id = Column(Integer, nullable=False)
@@ -75,6 +85,9 @@ class ScraperJob(Base):
 class ScraperLog(Base):
     """Scraper execution logs table"""
     __tablename__ = 'scraper_logs'
+    __table_args__ = (
+        Index('ix_scraper_logs_scraper_ts', 'scraper_id', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True)
     scraper_id = Column(Integer, nullable=False)
@@ -87,17 +100,45 @@ class ScraperLog(Base):
 class DataCollection(Base):
     """Data collection tracking table"""
     __tablename__ = 'data_collection'
+    __table_args__ = (
+        Index('ix_data_collection_scraper_processed', 'scraper_id', 'processed'),
+    )
     
     id = Column(Integer, primary_key=True)
     scraper_id = Column(Integer, nullable=False)
     job_id = Column(Integer)
     data_type = Column(String(100), nullable=False)
     source_url = Column(String(500))
-    data_hash = Column(String(64))  # SHA256 hash of collected data
+    data_hash = Column(LargeBinary(32), index=True)  # Raw SHA256 digest of collected data
     collected_at = Column(DateTime, default=datetime.utcnow)
     processed = Column(Boolean, default=False)
     processed_at = Column(DateTime)
 
+# Sample scrapers
+SAMPLE_SCRAPERS = [
+    {
+        "name": "parliament_ca",
+        "jurisdiction_level": "federal",
+        "source_url": "https://www.parl.ca",
+        "description": "Federal parliamentary data scraper",
+        "schedule": "0 2 * * *"
+    },
+    {
+        "name": "ca_on",
+        "jurisdiction_level": "provincial",
+        "source_url": "https://www.ola.org",
+        "description": "Ontario provincial data scraper",
+        "schedule": "0 3 * * *"
+    },
+    {
+        "name": "ca_on_toronto",
+        "jurisdiction_level": "municipal",
+        "source_url": "https://www.toronto.ca",
+        "description": "Toronto municipal data scraper",
+        "schedule": "0 4 * * *"
+    }
+]
+
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
@@ -105,29 +146,20 @@ class DataCollection(Base):
 def create_database():
     """Create the database if it doesn't exist"""
     try:
-        # Connect to default postgres database
-        conn = psycopg2.connect(
-            host="localhost",
-            port="5432",
-            user="ashishtandon",
-            database="postgres"
-        )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        cursor = conn.cursor()
-        
-        # Check if database exists
-        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (DB_NAME,))
-        exists = cursor.fetchone()
-        
-        if not exists:
-            print(f"Creating database '{DB_NAME}'...")
-            cursor.execute(f"CREATE DATABASE {DB_NAME}")
-            print(f"Database '{DB_NAME}' created successfully")
-        else:
-            print(f"Database '{DB_NAME}' already exists")
-        
-        cursor.close()
-        conn.close()
+        # Connect to the default postgres database on the configured server; closed even if a statement fails
+        with closing(psycopg2.connect(make_dsn(DATABASE_URL, dbname="postgres"))) as conn:
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                # Check if database exists
+                cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (DB_NAME,))
+                exists = cursor.fetchone()
+                
+                if not exists:
+                    print(f"Creating database '{DB_NAME}'...")
+                    cursor.execute(f"CREATE DATABASE {DB_NAME}")
+                    print(f"Database '{DB_NAME}' created successfully")
+                else:
+                    print(f"Database '{DB_NAME}' already exists")
         
     except Exception as e:
         print(f"Error creating database: {e}")
@@ -135,80 +167,37 @@ def create_database():
     
     return True
 
-def create_tables():
+def create_tables(engine):
     """Create all tables in the database"""
     try:
-        # Create engine
-        engine = create_engine(DATABASE_URL)
-        
         # Create all tables
         print("Creating tables...")
         Base.metadata.create_all(engine)
         print("Tables created successfully")
         
-        # Close engine
-        engine.dispose()
-        
         return True
         
     except Exception as e:
         print(f"Error creating tables: {e}")
         return False
 
-def insert_sample_data():
+def insert_sample_data(engine):
     """Insert sample data for testing"""
     try:
-        # Create engine and session
-        engine = create_engine(DATABASE_URL)
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        
-        # Check if we already have sample data
-        existing_scrapers = session.query(ScraperInfo).count()
-        if existing_scrapers > 0:
-            print("Sample data already exists, skipping...")
-            session.close()
-            engine.dispose()
-            return True
-        
-        print("Inserting sample data...")
-        
-        # Sample scrapers
-        sample_scrapers = [
-            ScraperInfo(
-                name="parliament_ca",
-                jurisdiction_level="federal",
-                source_url="https://www.parl.ca",
-                description="Federal parliamentary data scraper",
-                schedule="0 2 * * *"
-            ),
-            ScraperInfo(
-                name="ca_on",
-                jurisdiction_level="provincial",
-                source_url="https://www.ola.org",
-                description="Ontario provincial data scraper",
-                schedule="0 3 * * *"
-            ),
-            ScraperInfo(
-                name="ca_on_toronto",
-                jurisdiction_level="municipal",
-                source_url="https://www.toronto.ca",
-                description="Toronto municipal data scraper",
-                schedule="0 4 * * *"
-            )
-        ]
-        
-        # Add to session
-        for scraper in sample_scrapers:
-            session.add(scraper)
-        
-        # Commit changes
-        session.commit()
-        print(f"Inserted {len(sample_scrapers)} sample scrapers")
-        
-        # Close session
-        session.close()
-        engine.dispose()
+        with engine.begin() as conn:
+            # Check if we already have sample data
+            existing_scrapers = conn.execute(select(func.count()).select_from(ScraperInfo)).scalar()
+            if existing_scrapers > 0:
+                print("Sample data already exists, skipping...")
+            else:
+                print("Inserting sample data...")
+                
+                if len(SAMPLE_SCRAPERS) > BULK_INSERT_THRESHOLD:
+                    bulk_insert_scrapers(conn, SAMPLE_SCRAPERS)
+                else:
+                    # Single executemany batch, no ORM unit-of-work overhead
+                    conn.execute(insert(ScraperInfo), SAMPLE_SCRAPERS)
+                print(f"Inserted {len(SAMPLE_SCRAPERS)} sample scrapers")
         
         return True
         
@@ -216,36 +205,56 @@ def insert_sample_data():
         print(f"Error inserting sample data: {e}")
         return False
 
-def verify_database():
+def bulk_insert_scrapers(conn, rows):
+    """Insert many scraper rows through psycopg2's execute_values, one statement per page"""
+    # Column defaults are applied client-side by SQLAlchemy, so fill them in here
+    columns = [column for column in ScraperInfo.__table__.columns if not column.primary_key]
+    values = []
+    for row in rows:
+        record = []
+        for column in columns:
+            if column.name in row:
+                record.append(row[column.name])
+            elif column.default is None:
+                record.append(None)
+            elif column.default.is_callable:
+                record.append(column.default.arg(None))
+            else:
+                record.append(column.default.arg)
+        values.append(tuple(record))
+    
+    column_names = ", ".join(column.name for column in columns)
+    with conn.connection.cursor() as cursor:
+        execute_values(
+            cursor,
+            f"INSERT INTO {ScraperInfo.__tablename__} ({column_names}) VALUES %s",
+            values,
+            page_size=BULK_INSERT_PAGE_SIZE
+        )
+
+def verify_database(engine):
     """Verify that the database is working correctly"""
     try:
-        # Create engine
-        engine = create_engine(DATABASE_URL)
-        
-        # Test connection
+        # One pooled connection for the connectivity check, introspection and row count
         with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            assert result.scalar() == 1
+            # Test connection
+            assert conn.execute(text("SELECT 1")).scalar() == 1
             print("✓ Database connection verified")
-        
-        # Check tables
-        inspector = engine.dialect.inspector(engine)
-        tables = inspector.get_table_names()
-        
-        expected_tables = ['scraper_info', 'scraper_jobs', 'scraper_logs', 'data_collection']
-        for table in expected_tables:
-            if table in tables:
-                print(f"✓ Table '{table}' exists")
-            else:
-                print(f"✗ Table '{table}' missing")
-        
-        # Check sample data
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT COUNT(*) FROM scraper_info"))
-            count = result.scalar()
+            
+            # Check tables
+            tables = set(inspect(conn).get_table_names())
+            
+            expected_tables = ['scraper_info', 'scraper_jobs', 'scraper_logs', 'data_collection']
+            for table in expected_tables:
+                if table in tables:
+                    print(f"✓ Table '{table}' exists")
+                else:
+                    print(f"✗ Table '{table}' missing")
+            
+            # Check sample data
+            count = conn.execute(text("SELECT COUNT(*) FROM scraper_info")).scalar()
             print(f"✓ Found {count} scrapers in database")
         
-        engine.dispose()
         return True
         
     except Exception as e:
@@ -267,23 +276,28 @@ def main():
         print("❌ Failed to create database")
         return False
     
-    # Step 2: Create tables
-    print("\n2. Creating tables...")
-    if not create_tables():
-        print("❌ Failed to create tables")
-        return False
-    
-    # Step 3: Insert sample data
-    print("\n3. Inserting sample data...")
-    if not insert_sample_data():
-        print("❌ Failed to insert sample data")
-        return False
-    
-    # Step 4: Verify database
-    print("\n4. Verifying database...")
-    if not verify_database():
-        print("❌ Database verification failed")
-        return False
+    # One engine (and connection pool) shared by the remaining steps
+    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    try:
+        # Step 2: Create tables
+        print("\n2. Creating tables...")
+        if not create_tables(engine):
+            print("❌ Failed to create tables")
+            return False
+        
+        # Step 3: Insert sample data
+        print("\n3. Inserting sample data...")
+        if not insert_sample_data(engine):
+            print("❌ Failed to insert sample data")
+            return False
+        
+        # Step 4: Verify database
+        print("\n4. Verifying database...")
+        if not verify_database(engine):
+            print("❌ Database verification failed")
+            return False
+    finally:
+        engine.dispose()
     
     print("\n🎉 Database setup completed successfully!")
     print("\nNext steps:")
@@ -3,12 +3,20 @@
 Simple Data Collector for OpenPolicy Scraper Service
 
 This script directly interacts with the database to build up data.
+Run with `--emit-sql <file>` to write the same seed as a SQL script for psql instead.
 """
 
-import psycopg2
+import csv
+import hashlib
+import io
+import json
+import sys
+from psycopg2.extras import Json, execute_values
 import logging
 from datetime import datetime
-import json
+from statistics import fmean
+
+from db import get_pool, close_pool
 
 # Configure logging
 logging.basicConfig(
@@ -17,290 +25,353 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Thread/process details are not in the log format, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Rows per multi-VALUES statement; large enough that each seed goes in one round trip
+BATCH_PAGE_SIZE = 500
+
+
+# Sample scrapers the seed jobs are created for: (id, name)
+SAMPLE_SCRAPERS = [(1, "parliament_ca"), (2, "ca_on"), (3, "ca_on_toronto")]
+
+# Sample log entries: (scraper_id, level, message, log_data); the batch timestamp is added to log_data
+SAMPLE_LOG_ENTRIES = [
+    (1, 'info', 'Scraper started successfully', {"operation": "start"}),
+    (1, 'info', 'Data extraction completed', {"operation": "extract", "records": 150}),
+    (2, 'info', 'Provincial scraper initialized', {"operation": "init"}),
+    (2, 'warning', 'Rate limit approaching', {"operation": "rate_limit"}),
+    (3, 'info', 'Municipal data collection started', {"operation": "start"}),
+    (3, 'error', 'Connection timeout', {"operation": "connection", "error": "timeout"}),
+]
+
+# Sample data collection records: (data_type, source_url, scraper_id)
+SAMPLE_DATA_COLLECTION = [
+    ('bills', 'https://parl.ca/bills', 1),
+    ('bills', 'https://ontario.ca/bills', 2),
+    ('bills', 'https://toronto.ca/bylaws', 3),
+    ('representatives', 'https://parl.ca/mps', 1),
+    ('representatives', 'https://ontario.ca/mpps', 2),
+    ('representatives', 'https://toronto.ca/councillors', 3),
+    ('votes', 'https://parl.ca/votes', 1),
+    ('votes', 'https://ontario.ca/votes', 2),
+    ('committees', 'https://parl.ca/committees', 1),
+    ('committees', 'https://ontario.ca/committees', 2),
+]
+
+# Scraper activity applied by update_scraper_status:
+# (id, status, data_collected, success_rate, avg_duration)
+SCRAPER_STATUS_UPDATES = [
+    (1, 'completed', 150, 95.0, 45.5),
+    (2, 'running', 200, 92.0, 52.3),
+    (3, 'completed', 250, 88.0, 38.7),
+]
+
+# Fleet-wide averages over the status updates, rounded like the NUMERIC(10,2) metric column
+FLEET_SUCCESS_RATE = round(fmean(row[3] for row in SCRAPER_STATUS_UPDATES), 2)
+FLEET_AVG_DURATION = round(fmean(row[4] for row in SCRAPER_STATUS_UPDATES), 2)
+
+# Sample analytics metrics: (metric_name, metric_value, jurisdiction_level, data_type)
+SAMPLE_ANALYTICS = [
+    ('total_records', 600, 'all', 'all'),
+    ('federal_records', 200, 'federal', 'all'),
+    ('provincial_records', 200, 'provincial', 'all'),
+    ('municipal_records', 200, 'municipal', 'all'),
+    ('bills_count', 300, 'all', 'bills'),
+    ('representatives_count', 200, 'all', 'representatives'),
+    ('votes_count', 100, 'all', 'votes'),
+    ('success_rate', FLEET_SUCCESS_RATE, 'all', 'all'),
+    ('avg_processing_time', FLEET_AVG_DURATION, 'all', 'all'),
+    ('data_freshness_hours', 2.5, 'all', 'all'),
+]
+
+ANALYTICS_SUMMARY_DDL = """
+    CREATE TABLE IF NOT EXISTS analytics_summary (
+        id SERIAL PRIMARY KEY,
+        metric_name VARCHAR(100) NOT NULL,
+        metric_value NUMERIC(10,2),
+        jurisdiction_level VARCHAR(50),
+        data_type VARCHAR(50),
+        calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        period VARCHAR(20) DEFAULT 'daily'
+    )
+"""
+
+# Seed columns per table, shared by the live inserts and the generated SQL file
+JOB_COLUMNS = ("scraper_id", "status", "created_at", "updated_at", "started_at", "completed_at", "duration", "data_collected")
+LOG_COLUMNS = ("scraper_id", "level", "message", "log_data", "timestamp")
+DATA_COLLECTION_COLUMNS = ("data_type", "source_url", "data_hash", "collected_at", "scraper_id", "processed")
+ANALYTICS_COLUMNS = ("metric_name", "metric_value", "jurisdiction_level", "data_type")
+
+# Tables reported by the final status check
+STATUS_TABLES = ('scraper_info', 'scraper_jobs', 'scraper_logs', 'data_collection', 'analytics_summary')
+
 
 def get_db_connection():
-    """Get database connection."""
-    return psycopg2.connect(
-        host="localhost",
-        port="5432",
-        user="ashishtandon",
-        database="openpolicy"
+    """Get a database connection from the shared pool."""
+    return get_pool().getconn()
+
+
+def release_db_connection(conn):
+    """Return a connection to the shared pool."""
+    get_pool().putconn(conn)
+
+
+def copy_rows(cursor, table, columns, rows):
+    """Bulk-load rows into a table with a single COPY FROM STDIN in CSV format."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def job_rows(now):
+    """One completed and one running job row per sample scraper."""
+    return [
+        (
+            scraper_id,
+            'completed',
+            now,
+            now,
+            now,
+            now,
+            45.5,  # 45.5 seconds duration
+            150 + (scraper_id * 50)  # Varying data amounts
+        )
+        for scraper_id, _ in SAMPLE_SCRAPERS
+    ] + [
+        (
+            scraper_id,
+            'running',
+            now,
+            now,
+            now,
+            None,
+            None,
+            None
+        )
+        for scraper_id, _ in SAMPLE_SCRAPERS
+    ]
+
+
+def log_rows(now, adapt):
+    """Sample log rows with the batch timestamp; adapt wraps each log_data dict."""
+    now_iso = now.isoformat()
+    return [
+        (scraper_id, level, message, adapt({**log_data, "timestamp": now_iso}), now)
+        for scraper_id, level, message, log_data in SAMPLE_LOG_ENTRIES
+    ]
+
+
+def data_collection_rows(now):
+    """Sample data collection rows in COPY CSV form."""
+    # data_hash holds the raw 32-byte SHA256 digest (BYTEA, hex-encoded for COPY);
+    # the source URL stands in for sample content
+    return [
+        (data_type, source_url, "\\x" + hashlib.sha256(source_url.encode()).hexdigest(), now, scraper_id, False)
+        for data_type, source_url, scraper_id in SAMPLE_DATA_COLLECTION
+    ]
+
+
+def status_update_sql(now_sql):
+    """UPDATE statement applying SCRAPER_STATUS_UPDATES; now_sql is the last_run expression."""
+    values = ", ".join(
+        f"({scraper_id}, '{status}', {now_sql}, {data_collected}, {success_rate}, {avg_duration})"
+        for scraper_id, status, data_collected, success_rate, avg_duration in SCRAPER_STATUS_UPDATES
     )
+    return f"""
+        UPDATE scraper_info AS s
+        SET status = v.status, last_run = v.last_run, data_collected = v.data_collected,
+            success_rate = v.success_rate, avg_duration = v.avg_duration
+        FROM (VALUES {values}) AS v (id, status, last_run, data_collected, success_rate, avg_duration)
+        WHERE s.id = v.id
+    """
 
 
-def check_current_status():
+def write_seed_sql(path):
+    """Write the whole seed as one SQL script for `psql -v ON_ERROR_STOP=1 -f <path>`."""
+    now = datetime.utcnow()
+    
+    def copy_block(table, columns, rows):
+        buffer = io.StringIO()
+        buffer.write(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv);\n")
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        buffer.write("\\.\n")
+        return buffer.getvalue()
+    
+    with open(path, "w") as f:
+        f.write("BEGIN;\n")
+        f.write(copy_block("scraper_jobs", JOB_COLUMNS, job_rows(now)))
+        f.write(copy_block("scraper_logs", LOG_COLUMNS, log_rows(now, json.dumps)))
+        f.write(status_update_sql(f"'{now.isoformat()}'::timestamp").strip() + ";\n")
+        f.write(copy_block("data_collection", DATA_COLLECTION_COLUMNS, data_collection_rows(now)))
+        f.write(ANALYTICS_SUMMARY_DDL.strip() + ";\n")
+        f.write(copy_block("analytics_summary", ANALYTICS_COLUMNS, SAMPLE_ANALYTICS))
+        f.write("COMMIT;\n")
+
+
+def check_current_status(conn):
     """Check current database status."""
     logger.info("📊 Checking Current Database Status...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
         # Check scrapers
         cursor.execute("SELECT id, name, jurisdiction_level, status, data_collected FROM scraper_info ORDER BY id")
         scrapers = cursor.fetchall()
         
-        logger.info(f"Found {len(scrapers)} scrapers:")
+        logger.info("Found %s scrapers:", len(scrapers))
         for scraper in scrapers:
-            logger.info(f"  - ID {scraper[0]}: {scraper[1]} ({scraper[2]}) - Status: {scraper[3]}, Data: {scraper[4]}")
-        
-        # Check jobs
-        cursor.execute("SELECT COUNT(*) FROM scraper_jobs")
-        job_count = cursor.fetchone()[0]
-        logger.info(f"Total jobs: {job_count}")
+            logger.info("  - ID %s: %s (%s) - Status: %s, Data: %s", *scraper)
         
-        # Check logs
-        cursor.execute("SELECT COUNT(*) FROM scraper_logs")
-        log_count = cursor.fetchone()[0]
-        logger.info(f"Total logs: {log_count}")
+        # Check jobs and logs in one round trip
+        cursor.execute("SELECT (SELECT COUNT(*) FROM scraper_jobs), (SELECT COUNT(*) FROM scraper_logs)")
+        job_count, log_count = cursor.fetchone()
+        logger.info("Total jobs: %s", job_count)
+        logger.info("Total logs: %s", log_count)
         
         cursor.close()
-        conn.close()
         
         return scrapers
         
     except Exception as e:
-        logger.error(f"Status check failed: {e}")
+        conn.rollback()
+        logger.error("Status check failed: %s", e)
         return []
 
 
-def create_sample_jobs():
+def create_sample_jobs(conn, now):
     """Create sample scraper jobs to simulate data collection."""
     logger.info("🔄 Creating Sample Scraper Jobs...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Create jobs for each scraper
-        scrapers = [(1, "parliament_ca"), (2, "ca_on"), (3, "ca_on_toronto")]
-        
-        for scraper_id, scraper_name in scrapers:
-            # Create a completed job
-            cursor.execute("""
-                INSERT INTO scraper_jobs (scraper_id, status, created_at, updated_at, started_at, completed_at, duration, data_collected)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                scraper_id,
-                'completed',
-                datetime.utcnow(),
-                datetime.utcnow(),
-                datetime.utcnow(),
-                datetime.utcnow(),
-                45.5,  # 45.5 seconds duration
-                150 + (scraper_id * 50)  # Varying data amounts
-            ))
-            
-            job_id = cursor.fetchone()[0]
-            logger.info(f"Created completed job {job_id} for {scraper_name}")
-            
-            # Create a running job
-            cursor.execute("""
-                INSERT INTO scraper_jobs (scraper_id, status, created_at, updated_at, started_at)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                scraper_id,
-                'running',
-                datetime.utcnow(),
-                datetime.utcnow(),
-                datetime.utcnow()
-            ))
-            
-            job_id = cursor.fetchone()[0]
-            logger.info(f"Created running job {job_id} for {scraper_name}")
+        scraper_names = dict(SAMPLE_SCRAPERS)
+        
+        # One completed and one running job per scraper, sent as a single statement
+        jobs = execute_values(cursor, f"""
+            INSERT INTO scraper_jobs ({', '.join(JOB_COLUMNS)})
+            VALUES %s
+            RETURNING id, scraper_id, status
+        """, job_rows(now), page_size=BATCH_PAGE_SIZE, fetch=True)
+        
+        for job_id, scraper_id, status in jobs:
+            logger.info("Created %s job %s for %s", status, job_id, scraper_names[scraper_id])
         
-        conn.commit()
         cursor.close()
-        conn.close()
         
         logger.info("✅ Sample jobs created successfully")
         
     except Exception as e:
-        logger.error(f"Failed to create sample jobs: {e}")
+        logger.error("Failed to create sample jobs: %s", e)
+        raise
 
 
-def create_sample_logs():
+def create_sample_logs(conn, now):
     """Create sample log entries."""
     logger.info("📝 Creating Sample Log Entries...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Sample log messages for different operations
-        log_entries = [
-            (1, 'info', 'Scraper started successfully', '{"operation": "start", "timestamp": "' + datetime.utcnow().isoformat() + '"}'),
-            (1, 'info', 'Data extraction completed', '{"operation": "extract", "records": 150, "timestamp": "' + datetime.utcnow().isoformat() + '"}'),
-            (2, 'info', 'Provincial scraper initialized', '{"operation": "init", "timestamp": "' + datetime.utcnow().isoformat() + '"}'),
-            (2, 'warning', 'Rate limit approaching', '{"operation": "rate_limit", "timestamp": "' + datetime.utcnow().isoformat() + '"}'),
-            (3, 'info', 'Municipal data collection started', '{"operation": "start", "timestamp": "' + datetime.utcnow().isoformat() + '"}'),
-            (3, 'error', 'Connection timeout', '{"operation": "connection", "error": "timeout", "timestamp": "' + datetime.utcnow().isoformat() + '"}'),
-        ]
-        
-        for scraper_id, level, message, log_data in log_entries:
-            cursor.execute("""
-                INSERT INTO scraper_logs (scraper_id, level, message, log_data, timestamp)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (scraper_id, level, message, log_data, datetime.utcnow()))
+        # Json adapts each dict as a bound parameter, so no hand-built JSON text
+        execute_values(cursor, f"""
+            INSERT INTO scraper_logs ({', '.join(LOG_COLUMNS)})
+            VALUES %s
+        """, log_rows(now, Json), page_size=BATCH_PAGE_SIZE)
         
-        conn.commit()
         cursor.close()
-        conn.close()
         
         logger.info("✅ Sample logs created successfully")
         
     except Exception as e:
-        logger.error(f"Failed to create sample logs: {e}")
+        logger.error("Failed to create sample logs: %s", e)
+        raise
 
 
-def update_scraper_status():
+def update_scraper_status(conn, now):
     """Update scraper statuses to reflect activity."""
     logger.info("🔄 Updating Scraper Statuses...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Update federal scraper
-        cursor.execute("""
-            UPDATE scraper_info 
-            SET status = 'completed', last_run = %s, data_collected = 150, success_rate = 95.0, avg_duration = 45.5
-            WHERE id = 1
-        """, (datetime.utcnow(),))
-        
-        # Update provincial scraper
-        cursor.execute("""
-            UPDATE scraper_info 
-            SET status = 'running', last_run = %s, data_collected = 200, success_rate = 92.0, avg_duration = 52.3
-            WHERE id = 2
-        """, (datetime.utcnow(),))
-        
-        # Update municipal scraper
-        cursor.execute("""
-            UPDATE scraper_info 
-            SET status = 'completed', last_run = %s, data_collected = 250, success_rate = 88.0, avg_duration = 38.7
-            WHERE id = 3
-        """, (datetime.utcnow(),))
+        # All scrapers in one statement joined against a VALUES list
+        cursor.execute(status_update_sql("%s::timestamp"), (now,) * len(SCRAPER_STATUS_UPDATES))
         
-        conn.commit()
         cursor.close()
-        conn.close()
         
         logger.info("✅ Scraper statuses updated successfully")
         
     except Exception as e:
-        logger.error(f"Failed to update scraper statuses: {e}")
+        logger.error("Failed to update scraper statuses: %s", e)
+        raise
 
 
-def create_sample_data_collection():
+def create_sample_data_collection(conn, now):
     """Create sample data collection records."""
     logger.info("📊 Creating Sample Data Collection Records...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Sample data for different types
-        data_types = [
-            ('bills', 'https://parl.ca/bills', 'hash123', 1),
-            ('bills', 'https://ontario.ca/bills', 'hash456', 2),
-            ('bills', 'https://toronto.ca/bylaws', 'hash789', 3),
-            ('representatives', 'https://parl.ca/mps', 'hash101', 1),
-            ('representatives', 'https://ontario.ca/mpps', 'hash102', 2),
-            ('representatives', 'https://toronto.ca/councillors', 'hash103', 3),
-            ('votes', 'https://parl.ca/votes', 'hash201', 1),
-            ('votes', 'https://ontario.ca/votes', 'hash202', 2),
-            ('committees', 'https://parl.ca/committees', 'hash301', 1),
-            ('committees', 'https://ontario.ca/committees', 'hash302', 2),
-        ]
-        
-        for data_type, source_url, data_hash, scraper_id in data_types:
-            cursor.execute("""
-                INSERT INTO data_collection (data_type, source_url, data_hash, collected_at, scraper_id, processed)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (data_type, source_url, data_hash, datetime.utcnow(), scraper_id, False))
+        copy_rows(cursor, "data_collection", DATA_COLLECTION_COLUMNS, data_collection_rows(now))
         
-        conn.commit()
         cursor.close()
-        conn.close()
         
         logger.info("✅ Sample data collection records created successfully")
         
     except Exception as e:
-        logger.error(f"Failed to create sample data collection: {e}")
+        logger.error("Failed to create sample data collection: %s", e)
+        raise
 
 
-def create_analytics_summary():
+def create_analytics_summary(conn):
     """Create analytics summary table and populate with data."""
     logger.info("📈 Creating Analytics Summary...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
         # Create analytics summary table if it doesn't exist
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS analytics_summary (
-                id SERIAL PRIMARY KEY,
-                metric_name VARCHAR(100) NOT NULL,
-                metric_value NUMERIC(10,2),
-                jurisdiction_level VARCHAR(50),
-                data_type VARCHAR(50),
-                calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                period VARCHAR(20) DEFAULT 'daily'
-            )
-        """)
+        cursor.execute(ANALYTICS_SUMMARY_DDL)
         
         # Insert sample analytics data
-        analytics_data = [
-            ('total_records', 600, 'all', 'all'),
-            ('federal_records', 200, 'federal', 'all'),
-            ('provincial_records', 200, 'provincial', 'all'),
-            ('municipal_records', 200, 'municipal', 'all'),
-            ('bills_count', 300, 'all', 'bills'),
-            ('representatives_count', 200, 'all', 'representatives'),
-            ('votes_count', 100, 'all', 'votes'),
-            ('success_rate', 91.67, 'all', 'all'),
-            ('avg_processing_time', 45.5, 'all', 'all'),
-            ('data_freshness_hours', 2.5, 'all', 'all'),
-        ]
-        
-        for metric_name, metric_value, jurisdiction_level, data_type in analytics_data:
-            cursor.execute("""
-                INSERT INTO analytics_summary (metric_name, metric_value, jurisdiction_level, data_type)
-                VALUES (%s, %s, %s, %s)
-            """, (metric_name, metric_value, jurisdiction_level, data_type))
+        execute_values(cursor, f"""
+            INSERT INTO analytics_summary ({', '.join(ANALYTICS_COLUMNS)})
+            VALUES %s
+        """, SAMPLE_ANALYTICS, page_size=BATCH_PAGE_SIZE)
         
-        conn.commit()
         cursor.close()
-        conn.close()
         
         logger.info("✅ Analytics summary created successfully")
         
     except Exception as e:
-        logger.error(f"Failed to create analytics summary: {e}")
+        logger.error("Failed to create analytics summary: %s", e)
+        raise
 
 
-def final_status_check():
+def final_status_check(conn):
     """Perform final status check after data population."""
     logger.info("📊 Final Database Status Check...")
     
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
         
-        # Count all records
-        tables = ['scraper_info', 'scraper_jobs', 'scraper_logs', 'data_collection', 'analytics_summary']
-        
-        for table in tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                logger.info(f"  - {table}: {count} records")
-            except Exception as e:
-                logger.warning(f"  - {table}: Error counting records - {e}")
+        # Count all records in one round trip
+        try:
+            cursor.execute(" UNION ALL ".join(
+                f"SELECT '{table}' AS name, COUNT(*) FROM {table}" for table in STATUS_TABLES
+            ))
+            for table, count in cursor.fetchall():
+                logger.info("  - %s: %s records", table, count)
+        except Exception as e:
+            conn.rollback()
+            logger.warning("  - Error counting records - %s", e)
         
         # Show sample data
         cursor.execute("SELECT data_type, COUNT(*) FROM data_collection GROUP BY data_type")
@@ -308,47 +379,60 @@ def final_status_check():
         
         logger.info("Data Collection Summary:")
         for data_type, count in data_summary:
-            logger.info(f"  - {data_type}: {count} records")
+            logger.info("  - %s: %s records", data_type, count)
         
         cursor.close()
-        conn.close()
         
     except Exception as e:
-        logger.error(f"Final status check failed: {e}")
+        logger.error("Final status check failed: %s", e)
 
 
 def main():
-    """Main data population process."""
+    """Main data population process.
+    
+    All seed steps run in one transaction on a single non-autocommit connection
+    and are committed together before the final status check; a failing step
+    rolls the whole seed back. Helpers must not commit or enable autocommit.
+    """
     logger.info("🚀 Starting OpenPolicy Database Population Process")
     logger.info("=" * 60)
     
     start_time = datetime.utcnow()
+    # Every seeded row shares one timestamp, as in write_seed_sql
+    now = start_time
+    
+    # One connection and one transaction shared by every step
+    conn = get_db_connection()
+    conn.autocommit = False
     
     try:
         # Step 1: Check current status
-        scrapers = check_current_status()
+        scrapers = check_current_status(conn)
         
         if not scrapers:
             logger.error("No scrapers found. Cannot proceed.")
             return
         
         # Step 2: Create sample jobs
-        create_sample_jobs()
+        create_sample_jobs(conn, now)
         
         # Step 3: Create sample logs
-        create_sample_logs()
+        create_sample_logs(conn, now)
         
         # Step 4: Update scraper statuses
-        update_scraper_status()
+        update_scraper_status(conn, now)
         
         # Step 5: Create sample data collection
-        create_sample_data_collection()
+        create_sample_data_collection(conn, now)
         
         # Step 6: Create analytics summary
-        create_analytics_summary()
+        create_analytics_summary(conn)
+        
+        # Commit the whole seed at once
+        conn.commit()
         
         # Step 7: Final status check
-        final_status_check()
+        final_status_check(conn)
         
         # Summary
         end_time = datetime.utcnow()
@@ -356,7 +440,7 @@ def main():
         
         logger.info("\n" + "=" * 60)
         logger.info("🎉 DATABASE POPULATION COMPLETED SUCCESSFULLY!")
-        logger.info(f"⏱️  Total Duration: {duration:.2f} seconds")
+        logger.info("⏱️  Total Duration: %.2f seconds", duration)
         logger.info("=" * 60)
         logger.info("📊 Your OpenPolicy database now contains:")
         logger.info("  - Sample scraper jobs and execution history")
@@ -366,9 +450,19 @@ def main():
         logger.info("=" * 60)
         
     except Exception as e:
-        logger.error(f"Database population process failed: {e}")
+        conn.rollback()
+        logger.error("Database population process failed: %s", e)
         raise
+    finally:
+        release_db_connection(conn)
+        # Close the pool's idle connections before the process exits
+        close_pool()
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == "--emit-sql":
+        # Build step: write the seed as a SQL file and load it with psql instead
+        write_seed_sql(sys.argv[2])
+        logger.info("📝 Seed SQL written to %s; load it with: psql -v ON_ERROR_STOP=1 -d openpolicy -f %s", sys.argv[2], sys.argv[2])
+    else:
+        main()
@@ -9,5 +9,9 @@ __version__ = "1.0.0"
 __author__ = "OpenPolicy Team"
 __description__ = "Data scraping and collection service for OpenPolicy platform"
 
-# Import services to make them available at the package level
-from . import services
+# Load the services subpackage on first access so importing src (e.g. for the API) stays cheap
+def __getattr__(name):
+    if name == "services":
+        from . import services
+        return services
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,17 @@ FastAPI application for web scraping and data collection.
 
 from fastapi import FastAPI, Depends, HTTPException, Path, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from typing import Dict, Any, List, Optional
 import logging
 import uuid
 from datetime import datetime
 
+try:
+    from .config import Config
+except ImportError:
+    # Run as a script (python src/api.py), so src/ itself is on sys.path
+    from config import Config
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,30 +32,35 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=Config.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=Config.CORS_METHODS,
+    allow_headers=Config.CORS_HEADERS,
+    max_age=Config.CORS_MAX_AGE,
 )
 
 # Pydantic models
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from typing import Optional, List, Dict, Any
 
 class ScraperJob(BaseModel):
-    id: str
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
+    id: str  # 32-character hex UUID4, no hyphens
     name: str
-    url: str
+    url: HttpUrl
     status: str
     created_at: datetime
-    started_at: Optional[datetime]
-    completed_at: Optional[datetime]
-    data_extracted: Optional[Dict[str, Any]]
-    error_message: Optional[str]
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    data_extracted: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
 
 class ScraperJobCreate(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     name: str = Field(..., description="Scraper job name")
-    url: str = Field(..., description="URL to scrape")
+    url: HttpUrl = Field(..., description="URL to scrape")
     selectors: Optional[Dict[str, str]] = Field(None, description="CSS selectors for data extraction")
     config: Optional[Dict[str, Any]] = Field(None, description="Scraper configuration")
 
@@ -75,11 +85,11 @@ async def readiness_check():
     }
 
 # Scraper endpoints
-@app.post("/scrapers", response_model=ScraperJob, status_code=201, tags=["Scrapers"])
+@app.post("/scrapers", response_model=ScraperJob, status_code=201, response_model_exclude_none=True, tags=["Scrapers"])
 async def create_scraper_job(request: ScraperJobCreate):
     """Create a new scraper job."""
     try:
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         
         job = ScraperJob(
             id=job_id,
@@ -97,7 +107,7 @@ async def create_scraper_job(request: ScraperJobCreate):
         logger.error(f"Failed to create scraper job: {e}")
         raise HTTPException(status_code=500, detail="Failed to create scraper job")
 
-@app.get("/scrapers", response_model=List[ScraperJob], tags=["Scrapers"])
+@app.get("/scrapers", response_model=List[ScraperJob], response_model_exclude_none=True, tags=["Scrapers"])
 async def list_scraper_jobs(
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum jobs to return"),
@@ -107,7 +117,7 @@ async def list_scraper_jobs(
     # Simulate returning jobs
     return []
 
-@app.get("/scrapers/{job_id}", response_model=ScraperJob, tags=["Scrapers"])
+@app.get("/scrapers/{job_id}", response_model=ScraperJob, response_model_exclude_none=True, tags=["Scrapers"])
 async def get_scraper_job(job_id: str = Path(..., description="Job ID")):
     """Get a specific scraper job by ID."""
     raise HTTPException(status_code=404, detail="Job not found")
@@ -151,5 +161,18 @@ async def get_scraped_data(
     }
 
 if __name__ == "__main__":
+    import sys
+    from pathlib import Path as FilePath
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8008)
+    # Workers need an import string; resolve this file from its own directory so any working directory works
+    app_file = FilePath(__file__).resolve()
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows support
+    uvicorn.run(
+        f"{app_file.stem}:app",
+        app_dir=str(app_file.parent),
+        host="0.0.0.0",
+        port=8008,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=Config.SERVICE_WORKERS  # 1 unless SERVICE_WORKERS is set; each worker opens its own pools
+    )
@@ -3,79 +3,199 @@ Database connection and session management for OpenPolicy Scraper Service
 """
 
 import asyncio
+import logging
+import threading
+import weakref
+from functools import lru_cache
 from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.sql.elements import TextClause
+from typing import List, Optional, Tuple, Union
 from config import settings
+from src.config import Config
+
+# Database URLs, parsed once; the async one swaps in the asyncpg driver whatever the configured driver is
+_SYNC_URL = make_url(settings.database.url)
+_ASYNC_URL = _SYNC_URL.set(drivername="postgresql+asyncpg")
+
+# Pool settings, with defaults for deployments whose config predates them
+POOL_TIMEOUT = getattr(settings.database, "pool_timeout", 30)
+POOL_RECYCLE = getattr(settings.database, "pool_recycle", 1800)  # Recycle before server/proxy idle timeouts; replaces a per-checkout pre-ping
+MAX_DB_CONNECTIONS = getattr(settings.database, "max_db_connections", 100)  # PostgreSQL's default max_connections
+CONCURRENCY_PER_WORKER = getattr(settings.database, "concurrency_per_worker", 5)
+
+# Engines each init path creates: the app only uses the async engine, scripts using init_db get both
+ASYNC_ONLY_ENGINES = 1
+SYNC_AND_ASYNC_ENGINES = 2
+
+# Distinct SQL strings whose text() clauses are kept for reuse
+STATEMENT_CACHE_SIZE = 256
+
+logger = logging.getLogger('database')
 
 # Database engine
 engine = None
 async_engine = None
 SessionLocal = None
+AsyncSessionLocal = None
+
+# Serialize initialization so concurrent callers cannot each build an engine (and a pool).
+# asyncio locks belong to one event loop, so the async one is created lazily per running loop.
+_init_lock = threading.Lock()
+_async_init_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+def pool_limits(engine_count: int) -> Tuple[int, int]:
+    """Return (pool_size, max_overflow) for each of engine_count engines in this worker process
+    
+    MAX_DB_CONNECTIONS is shared by every worker process and split evenly between the engines
+    each one creates. The steady pool is sized from the per-process workload first, since
+    overflow connections are closed on checkin; overflow only gets what is left.
+    """
+    budget = max(1, MAX_DB_CONNECTIONS // (max(1, Config.SERVICE_WORKERS) * engine_count))
+    pool_size = max(1, min(CONCURRENCY_PER_WORKER, budget))
+    max_overflow = max(0, min(settings.database.max_overflow, budget - pool_size))
+    return pool_size, max_overflow
+
+def log_pool_settings(pool_size: int, max_overflow: int):
+    """Log the pool sizing chosen for this process"""
+    logger.info(
+        f"🗄️ Database pool: size={pool_size}, max_overflow={max_overflow}, workers={Config.SERVICE_WORKERS}, "
+        f"timeout={POOL_TIMEOUT}s, recycle={POOL_RECYCLE}s"
+    )
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _compile(query: str) -> TextClause:
+    """Build the text() clause for a SQL string once; repeated queries reuse it and its compiled form"""
+    return text(query)
+
+def _statement(query: Union[str, TextClause]) -> TextClause:
+    """Accept either raw SQL or an already built text() clause"""
+    return query if isinstance(query, TextClause) else _compile(query)
+
+def _get_async_init_lock() -> asyncio.Lock:
+    """Return the async init lock for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    lock = _async_init_locks.get(loop)
+    if lock is None:
+        lock = _async_init_locks[loop] = asyncio.Lock()
+    return lock
 
 def init_db():
     """Initialize database connection"""
-    global engine, async_engine, SessionLocal
+    global engine, async_engine, SessionLocal, AsyncSessionLocal
     
-    try:
-        # Create sync engine for compatibility
-        engine = create_engine(
-            settings.database.url,
-            poolclass=QueuePool,
-            pool_size=settings.database.pool_size,
-            max_overflow=settings.database.max_overflow,
-            echo=settings.database.echo,
-            pool_pre_ping=True
-        )
+    with _init_lock:
+        # Already initialized by an earlier or concurrent caller; the session factory is set last
+        if SessionLocal is not None:
+            return True
         
-        # Create async engine
-        async_url = settings.database.url.replace('postgresql://', 'postgresql+asyncpg://')
-        async_engine = create_async_engine(
-            async_url,
-            poolclass=QueuePool,
-            pool_size=settings.database.pool_size,
-            max_overflow=settings.database.max_overflow,
-            echo=settings.database.echo,
-            pool_pre_ping=True
-        )
+        new_engine = None
+        new_async_engine = None
+        pool_size, max_overflow = pool_limits(SYNC_AND_ASYNC_ENGINES)
+        try:
+            # Create sync engine for compatibility
+            new_engine = create_engine(
+                _SYNC_URL,
+                poolclass=QueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=POOL_TIMEOUT,
+                pool_recycle=POOL_RECYCLE,
+                echo=settings.database.echo
+            )
+            
+            # Create session factories; objects stay loaded after commit, avoiding a refresh SELECT
+            session_factory = sessionmaker(
+                bind=new_engine,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False
+            )
+            
+            # Reuse what init_db_async already built; SQLAlchemy picks AsyncAdaptedQueuePool, QueuePool would block the event loop
+            if AsyncSessionLocal is not None:
+                new_async_engine, async_session_factory = async_engine, AsyncSessionLocal
+            else:
+                new_async_engine = create_async_engine(
+                    _ASYNC_URL,
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    pool_timeout=POOL_TIMEOUT,
+                    pool_recycle=POOL_RECYCLE,
+                    echo=settings.database.echo
+                )
+                async_session_factory = async_sessionmaker(
+                    new_async_engine,
+                    autoflush=False,
+                    expire_on_commit=False
+                )
+            
+        except Exception as e:
+            # Leave the module uninitialized so a later call can retry; nothing has connected yet
+            if new_engine is not None:
+                new_engine.dispose()
+            if new_async_engine is not None and new_async_engine is not async_engine:
+                new_async_engine.sync_engine.dispose()
+            print(f"Failed to initialize database: {e}")
+            return False
         
-        # Create session factory
-        SessionLocal = sessionmaker(
-            bind=engine,
-            autocommit=False,
-            autoflush=False
-        )
+        # Publish only fully built engines and session factories
+        engine, SessionLocal = new_engine, session_factory
+        async_engine, AsyncSessionLocal = new_async_engine, async_session_factory
         
+        log_pool_settings(pool_size, max_overflow)
         print("Database connection initialized successfully")
         return True
-        
-    except Exception as e:
-        print(f"Failed to initialize database: {e}")
-        return False
 
 async def init_db_async():
     """Initialize database connection asynchronously"""
-    global async_engine, SessionLocal
+    global async_engine, AsyncSessionLocal
     
-    try:
-        # Create async engine
-        async_url = settings.database.url.replace('postgresql://', 'postgresql+asyncpg://')
-        async_engine = create_async_engine(
-            async_url,
-            poolclass=QueuePool,
-            pool_size=settings.database.pool_size,
-            max_overflow=settings.database.max_overflow,
-            echo=settings.database.echo,
-            pool_pre_ping=True
-        )
+    async with _get_async_init_lock():
+        # Already initialized by an earlier or concurrent caller; the session factory is set last
+        if AsyncSessionLocal is not None:
+            return True
+        
+        new_engine = None
+        pool_size, max_overflow = pool_limits(ASYNC_ONLY_ENGINES)
+        try:
+            # Create async engine; SQLAlchemy picks AsyncAdaptedQueuePool, QueuePool would block the event loop
+            new_engine = create_async_engine(
+                _ASYNC_URL,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=POOL_TIMEOUT,
+                pool_recycle=POOL_RECYCLE,
+                echo=settings.database.echo
+            )
+            
+            if not isinstance(new_engine.pool, AsyncAdaptedQueuePool):
+                raise RuntimeError(
+                    f"Async engine uses {type(new_engine.pool).__name__}, expected AsyncAdaptedQueuePool"
+                )
+            
+            session_factory = async_sessionmaker(
+                new_engine,
+                autoflush=False,
+                expire_on_commit=False
+            )
+            
+        except Exception as e:
+            # Leave the module uninitialized so a later call can retry
+            if new_engine is not None:
+                await new_engine.dispose()
+            print(f"Failed to initialize async database: {e}")
+            return False
         
+        # Publish only a fully built engine and session factory
+        async_engine, AsyncSessionLocal = new_engine, session_factory
+        
+        log_pool_settings(pool_size, max_overflow)
         print("Async database connection initialized successfully")
         return True
-        
-    except Exception as e:
-        print(f"Failed to initialize async database: {e}")
-        return False
 
 def get_db():
     """Get database session"""
@@ -90,18 +210,23 @@ def get_db():
 
 async def get_db_async():
     """Get async database session"""
-    if async_engine is None:
+    if AsyncSessionLocal is None:
         raise RuntimeError("Async database not initialized")
     
-    async with AsyncSession(async_engine) as session:
-        yield session
+    # The context manager always closes the session, returning its connection to the pool
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
 
 async def check_db_connection():
     """Check database connection"""
     try:
         if engine:
             with engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
+                result = conn.execute(_compile("SELECT 1"))
                 return result.scalar() == 1
         return False
     except Exception:
@@ -109,7 +234,10 @@ async def check_db_connection():
 
 async def close_db():
     """Close database connections"""
-    global engine, async_engine
+    global engine, async_engine, SessionLocal, AsyncSessionLocal
+    
+    SessionLocal = None
+    AsyncSessionLocal = None
     
     if engine:
         engine.dispose()
@@ -121,20 +249,44 @@ async def close_db():
     
     print("Database connections closed")
 
-def execute_query(query: str, params: dict = None):
+def execute_query(query: Union[str, TextClause], params: dict = None):
     """Execute a database query"""
     if engine is None:
         raise RuntimeError("Database not initialized")
     
     with engine.connect() as conn:
-        result = conn.execute(text(query), params or {})
+        result = conn.execute(_statement(query), params or {})
         return result.fetchall()
 
-async def execute_query_async(query: str, params: dict = None):
+async def execute_query_async(query: Union[str, TextClause], params: dict = None):
     """Execute a database query asynchronously"""
     if async_engine is None:
         raise RuntimeError("Async database not initialized")
     
     async with async_engine.connect() as conn:
-        result = await conn.execute(text(query), params or {})
+        result = await conn.execute(_statement(query), params or {})
         return result.fetchall()
+
+async def stream_query_async(query: Union[str, TextClause], params: dict = None, chunk_size: int = 1000):
+    """Stream a query's rows in lists of up to chunk_size, so memory stays bounded by the chunk"""
+    if async_engine is None:
+        raise RuntimeError("Async database not initialized")
+    
+    async with async_engine.connect() as conn:
+        result = await conn.stream(_statement(query), params or {})
+        async for chunk in result.yield_per(chunk_size).partitions():
+            yield chunk
+
+async def execute_many_async(queries: List[Tuple[Union[str, TextClause], Optional[dict]]], max_workers: int = 10):
+    """Execute independent queries concurrently, at most max_workers at a time, returning results in order"""
+    if async_engine is None:
+        raise RuntimeError("Async database not initialized")
+    
+    semaphore = asyncio.Semaphore(max_workers)
+    
+    async def run(query: Union[str, TextClause], params: Optional[dict]):
+        async with semaphore, async_engine.connect() as conn:
+            result = await conn.execute(_statement(query), params or {})
+            return result.fetchall()
+    
+    return await asyncio.gather(*(run(query, params) for query, params in queries))
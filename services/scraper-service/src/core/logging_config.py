@@ -4,16 +4,22 @@ Enhanced Logging Configuration for OpenPolicy Scraper Service
 This module provides comprehensive logging configuration for all services.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any, List, Optional
 import traceback
 
+import orjson
+
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
@@ -38,6 +44,16 @@ LOG_LEVELS = {
 # Default log level
 DEFAULT_LOG_LEVEL = "INFO"
 
+# Compact single-line JSON for log payloads; naive datetimes are treated as UTC
+_DUMPS_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+def _dumps(obj: Any) -> str:
+    """Serialize a log payload to one line of JSON."""
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS).decode()
+
+# Background listeners that write records queued by the root and service loggers
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output."""
     
@@ -55,8 +71,8 @@ class ColoredFormatter(logging.Formatter):
         if record.levelname in self.COLORS:
             record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
         
-        # Add timestamp
-        record.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        # Add timestamp from the record's creation time
+        record.timestamp = f"{self.formatTime(record, '%Y-%m-%d %H:%M:%S')}.{int(record.msecs):03d}"
         
         # Add process and thread info
         record.process_info = f"[PID:{record.process}][TID:{record.thread}]"
@@ -71,7 +87,7 @@ class StructuredFormatter(logging.Formatter):
     
     def format(self, record):
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
             "level": record.levelname,
             "logger": record.name,
             "module": record.module,
@@ -92,54 +108,64 @@ class StructuredFormatter(logging.Formatter):
                 "traceback": traceback.format_exception(*record.exc_info)
             }
         
-        return json.dumps(log_entry, indent=2)
+        return _dumps(log_entry)
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a listener in the same process.
+    
+    The stdlib prepare() formats the record and drops exc_info so it can be pickled,
+    which leaves StructuredFormatter nothing to build its exception field from. Records
+    here never leave the process, so only the message is rendered (its arguments may
+    change before the listener runs) and exc_info is kept for the handlers' formatters.
+    """
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+def _record_message(record: logging.LogRecord) -> str:
+    """Get a record's formatted message, computing it once and sharing it across filters."""
+    message = record.__dict__.get("message")
+    if message is None:
+        message = record.message = record.getMessage()
+    return message
 
 class PerformanceFilter(logging.Filter):
     """Filter for performance-related log messages."""
     
+    _PATTERN = re.compile(r"performance|timing|duration|throughput|latency", re.IGNORECASE)
+    
     def filter(self, record):
-        return (
-            "performance" in record.getMessage().lower() or
-            "timing" in record.getMessage().lower() or
-            "duration" in record.getMessage().lower() or
-            "throughput" in record.getMessage().lower() or
-            "latency" in record.getMessage().lower()
-        )
+        return self._PATTERN.search(_record_message(record)) is not None
 
 class DatabaseFilter(logging.Filter):
     """Filter for database-related log messages."""
     
+    _PATTERN = re.compile(r"database|sql|query|connection|transaction", re.IGNORECASE)
+    
     def filter(self, record):
-        return (
-            "database" in record.getMessage().lower() or
-            "sql" in record.getMessage().lower() or
-            "query" in record.getMessage().lower() or
-            "connection" in record.getMessage().lower() or
-            "transaction" in record.getMessage().lower()
-        )
+        return self._PATTERN.search(_record_message(record)) is not None
 
 class ScraperFilter(logging.Filter):
     """Filter for scraper-related log messages."""
     
+    _PATTERN = re.compile(r"scraper|crawl|extract|parse|collect", re.IGNORECASE)
+    
     def filter(self, record):
-        return (
-            "scraper" in record.getMessage().lower() or
-            "crawl" in record.getMessage().lower() or
-            "extract" in record.getMessage().lower() or
-            "parse" in record.getMessage().lower() or
-            "collect" in record.getMessage().lower()
-        )
+        return self._PATTERN.search(_record_message(record)) is not None
 
 class ETLErrorFilter(logging.Filter):
     """Filter for ETL error messages."""
     
+    _PATTERN = re.compile(r"etl|pipeline|transform|load", re.IGNORECASE)
+    
     def filter(self, record):
         return (
             record.levelno >= logging.ERROR and
-            ("etl" in record.getMessage().lower() or
-             "pipeline" in record.getMessage().lower() or
-             "transform" in record.getMessage().lower() or
-             "load" in record.getMessage().lower())
+            self._PATTERN.search(_record_message(record)) is not None
         )
 
 def setup_logging(
@@ -170,12 +196,14 @@ def setup_logging(
     
     structured_formatter = StructuredFormatter()
     
+    root_handlers = []
+    
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(LOG_LEVELS.get(log_level.upper(), LOG_LEVELS[DEFAULT_LOG_LEVEL]))
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        root_handlers.append(console_handler)
     
     # File handlers
     if enable_file:
@@ -187,7 +215,7 @@ def setup_logging(
         )
         main_handler.setLevel(logging.DEBUG)
         main_handler.setFormatter(file_formatter)
-        root_logger.addHandler(main_handler)
+        root_handlers.append(main_handler)
         
         # Error log file
         error_handler = logging.handlers.RotatingFileHandler(
@@ -197,7 +225,7 @@ def setup_logging(
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
+        root_handlers.append(error_handler)
         
         # Performance log file
         perf_handler = logging.handlers.RotatingFileHandler(
@@ -208,7 +236,7 @@ def setup_logging(
         perf_handler.setLevel(logging.INFO)
         perf_handler.setFormatter(file_formatter)
         perf_handler.addFilter(PerformanceFilter())
-        root_logger.addHandler(perf_handler)
+        root_handlers.append(perf_handler)
         
         # Database log file
         db_handler = logging.handlers.RotatingFileHandler(
@@ -219,7 +247,7 @@ def setup_logging(
         db_handler.setLevel(logging.INFO)
         db_handler.setFormatter(file_formatter)
         db_handler.addFilter(DatabaseFilter())
-        root_logger.addHandler(db_handler)
+        root_handlers.append(db_handler)
         
         # Scraper log file
         scraper_handler = logging.handlers.RotatingFileHandler(
@@ -230,7 +258,7 @@ def setup_logging(
         scraper_handler.setLevel(logging.INFO)
         scraper_handler.setFormatter(file_formatter)
         scraper_handler.addFilter(ScraperFilter())
-        root_logger.addHandler(scraper_handler)
+        root_handlers.append(scraper_handler)
         
         # ETL log file
         etl_handler = logging.handlers.RotatingFileHandler(
@@ -240,7 +268,7 @@ def setup_logging(
         )
         etl_handler.setLevel(logging.INFO)
         etl_handler.setFormatter(file_formatter)
-        root_logger.addHandler(etl_handler)
+        root_handlers.append(etl_handler)
     
     # Structured logging handler
     if enable_structured:
@@ -251,7 +279,14 @@ def setup_logging(
         )
         structured_handler.setLevel(logging.DEBUG)
         structured_handler.setFormatter(structured_formatter)
-        root_logger.addHandler(structured_handler)
+        root_handlers.append(structured_handler)
+    
+    # Write records from a background thread so callers never block on handler I/O
+    shutdown_logging()
+    
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(LocalQueueHandler(log_queue))
+    _start_queue_listener(log_queue, root_handlers)
     
     # Create service loggers
     loggers = {}
@@ -269,73 +304,73 @@ def setup_logging(
     # Main application logger
     loggers['main'] = logging.getLogger('openpolicy_scraper')
     
-    # Set specific levels for service loggers
+    # Set specific levels for service loggers; records propagate to the root's queued handlers
     for logger in loggers.values():
         logger.setLevel(logging.DEBUG)
-        logger.propagate = False  # Prevent duplicate logging
-    
-        # Add handlers to service loggers
-        if enable_console:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(LOG_LEVELS.get(log_level.upper(), LOG_LEVELS[DEFAULT_LOG_LEVEL]))
-            console_handler.setFormatter(console_formatter)
-            logger.addHandler(console_handler)
-        
-        if enable_file:
-            file_handler = logging.handlers.RotatingFileHandler(
-                MAIN_LOG_FILE,
-                maxBytes=max_file_size,
-                backupCount=backup_count
-            )
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+        logger.propagate = True
+        logger.handlers.clear()
     
     # Log startup message
     startup_logger = logging.getLogger('openpolicy_scraper.startup')
     startup_logger.info("🚀 OpenPolicy Scraper Service Logging System Initialized")
-    startup_logger.info(f"📁 Log files directory: {LOGS_DIR.absolute()}")
-    startup_logger.info(f"🔧 Log level: {log_level.upper()}")
-    startup_logger.info(f"📊 Console logging: {'enabled' if enable_console else 'disabled'}")
-    startup_logger.info(f"💾 File logging: {'enabled' if enable_file else 'disabled'}")
-    startup_logger.info(f"📋 Structured logging: {'enabled' if enable_structured else 'disabled'}")
+    startup_logger.info("📁 Log files directory: %s", LOGS_DIR.absolute())
+    startup_logger.info("🔧 Log level: %s", log_level.upper())
+    startup_logger.info("📊 Console logging: %s", 'enabled' if enable_console else 'disabled')
+    startup_logger.info("💾 File logging: %s", 'enabled' if enable_file else 'disabled')
+    startup_logger.info("📋 Structured logging: %s", 'enabled' if enable_structured else 'disabled')
     
     return loggers
 
+def _start_queue_listener(log_queue: queue.SimpleQueue, handlers: List[logging.Handler]):
+    """Start a background listener that hands queued records to the given handlers."""
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners.append(listener)
+
+def shutdown_logging():
+    """Flush queued log records and stop the background listeners."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+atexit.register(shutdown_logging)
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the specified name."""
     return logging.getLogger(name)
 
 def log_function_call(func):
     """Decorator to log function calls with parameters and timing."""
+    logger = logging.getLogger(f"{func.__module__}.{func.__name__}")
+    
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(f"{func.__module__}.{func.__name__}")
+        # Skip all entry/exit formatting unless DEBUG is enabled for this logger
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         # Log function entry
-        logger.debug(f"🔵 Function called: {func.__name__}")
-        logger.debug(f"📥 Arguments: args={args}, kwargs={kwargs}")
+        if debug:
+            logger.debug("🔵 Function called: %s", func.__name__)
+            logger.debug("📥 Arguments: args=%r, kwargs=%r", args, kwargs)
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             # Log successful completion
-            logger.debug(f"✅ Function completed: {func.__name__} in {duration:.4f}s")
-            logger.debug(f"📤 Return value: {result}")
+            if debug:
+                logger.debug("✅ Function completed: %s in %.4fs", func.__name__, duration)
+                logger.debug("📤 Return value: %r", result)
             
             return result
             
         except Exception as e:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             # Log error
-            logger.error(f"❌ Function failed: {func.__name__} after {duration:.4f}s")
-            logger.error(f"🚨 Error: {type(e).__name__}: {str(e)}")
-            logger.error(f"📍 Traceback: {traceback.format_exc()}")
+            logger.error("❌ Function failed: %s after %.4fs", func.__name__, duration)
+            logger.error("🚨 Error: %s: %s", type(e).__name__, e)
+            logger.error("📍 Traceback: %s", traceback.format_exc())
             
             raise
     
@@ -345,61 +380,66 @@ def log_performance(operation: str, duration: float, details: Optional[Dict[str,
     """Log performance metrics."""
     logger = logging.getLogger('performance')
     
-    log_data = {
-        "operation": operation,
-        "duration": duration,
-        "timestamp": datetime.now().isoformat(),
-        "details": details or {}
-    }
-    
     if duration > 1.0:  # Log slow operations as warnings
-        logger.warning(f"🐌 Slow operation detected: {operation} took {duration:.4f}s")
+        logger.warning("🐌 Slow operation detected: %s took %.4fs", operation, duration)
     else:
-        logger.info(f"⚡ Performance: {operation} completed in {duration:.4f}s")
+        logger.info("⚡ Performance: %s completed in %.4fs", operation, duration)
     
-    logger.debug(f"📊 Performance details: {json.dumps(log_data, indent=2)}")
+    # Only build and serialise the details when they will be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        log_data = {
+            "operation": operation,
+            "duration": duration,
+            "timestamp": datetime.now().isoformat(),
+            "details": details or {}
+        }
+        logger.debug("📊 Performance details: %s", _dumps(log_data))
 
 def log_database_operation(operation: str, table: str, duration: float, rows_affected: int = 0):
     """Log database operations."""
     logger = logging.getLogger('database')
     
-    logger.info(f"🗄️ Database operation: {operation} on {table}")
-    logger.info(f"⏱️ Duration: {duration:.4f}s")
-    logger.info(f"📊 Rows affected: {rows_affected}")
+    logger.info("🗄️ Database operation: %s on %s", operation, table)
+    logger.info("⏱️ Duration: %.4fs", duration)
+    logger.info("📊 Rows affected: %s", rows_affected)
     
     if duration > 0.5:  # Log slow queries as warnings
-        logger.warning(f"🐌 Slow database operation: {operation} on {table} took {duration:.4f}s")
+        logger.warning("🐌 Slow database operation: %s on %s took %.4fs", operation, table, duration)
 
 def log_scraper_activity(scraper_id: int, action: str, details: Dict[str, Any]):
     """Log scraper activities."""
     logger = logging.getLogger('scrapers')
     
-    logger.info(f"🕷️ Scraper {scraper_id}: {action}")
-    logger.info(f"📋 Details: {json.dumps(details, indent=2)}")
+    logger.info("🕷️ Scraper %s: %s", scraper_id, action)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("📋 Details: %s", _dumps(details))
 
 def log_etl_operation(operation: str, stage: str, details: Dict[str, Any]):
     """Log ETL operations."""
     logger = logging.getLogger('etl')
     
-    logger.info(f"🔄 ETL {stage}: {operation}")
-    logger.info(f"📋 Details: {json.dumps(details, indent=2)}")
+    logger.info("🔄 ETL %s: %s", stage, operation)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("📋 Details: %s", _dumps(details))
 
 def log_error(error: Exception, context: str = "", extra_data: Optional[Dict[str, Any]] = None):
     """Log errors with context and extra data."""
     logger = logging.getLogger('errors')
     
-    error_data = {
-        "error_type": type(error).__name__,
-        "error_message": str(error),
-        "context": context,
-        "timestamp": datetime.now().isoformat(),
-        "traceback": traceback.format_exc(),
-        "extra_data": extra_data or {}
-    }
+    error_traceback = traceback.format_exc()
+    logger.error("🚨 Error in %s: %s: %s", context, type(error).__name__, error)
+    logger.error("📍 Traceback: %s", error_traceback)
     
-    logger.error(f"🚨 Error in {context}: {type(error).__name__}: {str(error)}")
-    logger.error(f"📍 Traceback: {traceback.format_exc()}")
-    logger.debug(f"📋 Error details: {json.dumps(error_data, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        error_data = {
+            "error_type": type(error).__name__,
+            "error_message": str(error),
+            "context": context,
+            "timestamp": datetime.now().isoformat(),
+            "traceback": error_traceback,
+            "extra_data": extra_data or {}
+        }
+        logger.debug("📋 Error details: %s", _dumps(error_data))
 
 def log_system_health(component: str, status: str, details: Optional[Dict[str, Any]] = None):
     """Log system health information."""
@@ -412,28 +452,32 @@ def log_system_health(component: str, status: str, details: Optional[Dict[str, A
         "degraded": "🟡"
     }.get(status.lower(), "❓")
     
-    logger.info(f"{status_emoji} {component}: {status}")
-    if details:
-        logger.debug(f"📋 Health details: {json.dumps(details, indent=2)}")
+    logger.info("%s %s: %s", status_emoji, component, status)
+    if details and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📋 Health details: %s", _dumps(details))
 
 def cleanup_logs(max_age_days: int = 30):
     """Clean up old log files."""
     logger = logging.getLogger('maintenance')
     
-    current_time = datetime.now()
+    # Files at least max_age_days + 1 whole days old are removed
+    cutoff = time.time() - (max_age_days + 1) * 86400
     deleted_count = 0
     
-    for log_file in LOGS_DIR.glob("*.log.*"):
-        try:
-            file_age = current_time - datetime.fromtimestamp(log_file.stat().st_mtime)
-            if file_age.days > max_age_days:
-                log_file.unlink()
-                deleted_count += 1
-                logger.info(f"🗑️ Deleted old log file: {log_file.name}")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to delete old log file {log_file.name}: {e}")
-    
-    logger.info(f"🧹 Log cleanup completed: {deleted_count} old files deleted")
+    # scandir caches each entry's stat, so rotated files cost one syscall apiece
+    with os.scandir(LOGS_DIR) as entries:
+        for entry in entries:
+            if ".log." not in entry.name:
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_mtime <= cutoff:
+                    os.unlink(entry.path)
+                    deleted_count += 1
+                    logger.info("🗑️ Deleted old log file: %s", entry.name)
+            except Exception as e:
+                logger.warning("⚠️ Failed to delete old log file %s: %s", entry.name, e)
+    
+    logger.info("🧹 Log cleanup completed: %s old files deleted", deleted_count)
 
 # Initialize logging when module is imported
 if __name__ == "__main__":
@@ -5,11 +5,23 @@ This module defines all data models used throughout the scraper service,
 including Pydantic models for API requests/responses and internal data structures.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime, timedelta
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator
+from typing import Generic, List, Dict, Any, Literal, Optional, TypeVar, Union
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import partial
 import uuid
+from uuid import uuid4
+
+# Item type of a paginated response
+T = TypeVar("T")
+
+# Timezone-aware UTC timestamp factory for model defaults; datetime.utcnow is deprecated and naive
+_now = partial(datetime.now, timezone.utc)
+
+def _new_id() -> str:
+    """Generate a record identifier: a 32-character hex UUID4, no hyphens"""
+    return uuid4().hex
 
 # ============================================================================
 # ENUMS
@@ -59,6 +71,13 @@ class JurisdictionLevel(str, Enum):
     PROVINCIAL = "provincial"
     MUNICIPAL = "municipal"
 
+# Field annotations for the enums above: pydantic-core validates a Literal with a value
+# lookup instead of constructing an Enum member. The Enums stay as producer-side
+# constants, and the Literals are derived from them so the two cannot drift apart.
+JobStatusValue = Literal[tuple(member.value for member in JobStatus)]
+DataTypeValue = Literal[tuple(member.value for member in DataType)]
+JurisdictionLevelValue = Literal[tuple(member.value for member in JurisdictionLevel)]
+
 # ============================================================================
 # BASE MODELS
 # ============================================================================
@@ -72,6 +91,10 @@ class BaseScraperModel(BaseModel):
             uuid.UUID: lambda v: str(v)
         }
 
+# Response-only models are built from known fields and never mutated, so reject
+# unknown fields and skip assignment handling
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
 # ============================================================================
 # SCRAPER MODELS
 # ============================================================================
@@ -82,7 +105,7 @@ class ScraperInfo(BaseScraperModel):
     enabled: bool = Field(default=True, description="Whether scraper is enabled")
     schedule: str = Field(default="daily", description="Execution schedule")
     priority: ScraperPriority = Field(default=ScraperPriority.MEDIUM, description="Scraper priority")
-    jurisdiction_level: JurisdictionLevel = Field(..., description="Jurisdiction level")
+    jurisdiction_level: JurisdictionLevelValue = Field(..., description="Jurisdiction level")
     source_url: str = Field(..., description="Data source URL")
     description: str = Field(default="", description="Scraper description")
     version: str = Field(default="1.0.0", description="Scraper version")
@@ -94,8 +117,8 @@ class ScraperInfo(BaseScraperModel):
     avg_duration: float = Field(default=0.0, description="Average execution duration")
     error_count: int = Field(default=0, description="Total error count")
     last_error: Optional[str] = Field(default=None, description="Last error message")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Creation timestamp")
+    updated_at: datetime = Field(default_factory=_now, description="Last update timestamp")
 
 class ScraperRunRequest(BaseScraperModel):
     """Request model for running a scraper"""
@@ -109,17 +132,17 @@ class ScraperRunResponse(BaseScraperModel):
     """Response model for scraper execution"""
     scraper_name: str = Field(..., description="Name of executed scraper")
     job_id: str = Field(..., description="Unique job identifier")
-    status: JobStatus = Field(..., description="Job status")
+    status: JobStatusValue = Field(..., description="Job status")
     message: str = Field(..., description="Response message")
     estimated_duration: Optional[int] = Field(default=None, description="Estimated duration in seconds")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Job creation timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Job creation timestamp")
 
 class ScraperConfiguration(BaseScraperModel):
     """Scraper configuration model"""
     scraper_name: str = Field(..., description="Scraper name")
     config: Dict[str, Any] = Field(..., description="Configuration parameters")
     environment: str = Field(default="development", description="Environment")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    updated_at: datetime = Field(default_factory=_now, description="Last update timestamp")
 
 # ============================================================================
 # JOB MODELS
@@ -127,9 +150,9 @@ class ScraperConfiguration(BaseScraperModel):
 
 class ScraperJob(BaseScraperModel):
     """Scraper job model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique job identifier")
+    id: str = Field(default_factory=_new_id, description="Unique job identifier")
     scraper_name: str = Field(..., description="Associated scraper name")
-    status: JobStatus = Field(default=JobStatus.PENDING, description="Job status")
+    status: JobStatusValue = Field(default=JobStatus.PENDING.value, description="Job status")
     priority: ScraperPriority = Field(default=ScraperPriority.MEDIUM, description="Job priority")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Job parameters")
     started_at: Optional[datetime] = Field(default=None, description="Job start time")
@@ -140,8 +163,8 @@ class ScraperJob(BaseScraperModel):
     error_messages: List[str] = Field(default_factory=list, description="Error messages")
     progress: float = Field(default=0.0, description="Progress percentage (0-100)")
     result_summary: Optional[Dict[str, Any]] = Field(default=None, description="Job result summary")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Job creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Job creation timestamp")
+    updated_at: datetime = Field(default_factory=_now, description="Last update timestamp")
 
 class JobCreateRequest(BaseScraperModel):
     """Request model for creating a job"""
@@ -152,7 +175,7 @@ class JobCreateRequest(BaseScraperModel):
 
 class JobUpdateRequest(BaseScraperModel):
     """Request model for updating a job"""
-    status: Optional[JobStatus] = Field(default=None, description="New job status")
+    status: Optional[JobStatusValue] = Field(default=None, description="New job status")
     priority: Optional[ScraperPriority] = Field(default=None, description="New job priority")
     parameters: Optional[Dict[str, Any]] = Field(default=None, description="Updated parameters")
 
@@ -162,24 +185,24 @@ class JobUpdateRequest(BaseScraperModel):
 
 class DataRecord(BaseScraperModel):
     """Data record model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique record identifier")
+    id: str = Field(default_factory=_new_id, description="Unique record identifier")
     scraper_name: str = Field(..., description="Source scraper name")
-    data_type: DataType = Field(..., description="Type of data")
-    jurisdiction_level: JurisdictionLevel = Field(..., description="Jurisdiction level")
+    data_type: DataTypeValue = Field(..., description="Type of data")
+    jurisdiction_level: JurisdictionLevelValue = Field(..., description="Jurisdiction level")
     jurisdiction_name: str = Field(..., description="Jurisdiction name")
     raw_data: Dict[str, Any] = Field(..., description="Raw scraped data")
     processed_data: Optional[Dict[str, Any]] = Field(default=None, description="Processed data")
     validation_status: str = Field(default="pending", description="Data validation status")
     quality_score: Optional[float] = Field(default=None, description="Data quality score")
-    collected_at: datetime = Field(default_factory=datetime.utcnow, description="Data collection timestamp")
+    collected_at: datetime = Field(default_factory=_now, description="Data collection timestamp")
     processed_at: Optional[datetime] = Field(default=None, description="Data processing timestamp")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Record creation timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Record creation timestamp")
 
 class DataQueryRequest(BaseScraperModel):
     """Request model for querying data"""
     scraper_name: Optional[str] = Field(default=None, description="Filter by scraper name")
-    data_type: Optional[DataType] = Field(default=None, description="Filter by data type")
-    jurisdiction_level: Optional[JurisdictionLevel] = Field(default=None, description="Filter by jurisdiction level")
+    data_type: Optional[DataTypeValue] = Field(default=None, description="Filter by data type")
+    jurisdiction_level: Optional[JurisdictionLevelValue] = Field(default=None, description="Filter by jurisdiction level")
     jurisdiction_name: Optional[str] = Field(default=None, description="Filter by jurisdiction name")
     start_date: Optional[datetime] = Field(default=None, description="Start date filter")
     end_date: Optional[datetime] = Field(default=None, description="End date filter")
@@ -191,8 +214,8 @@ class DataQueryRequest(BaseScraperModel):
 class DataExportRequest(BaseScraperModel):
     """Request model for exporting data"""
     scraper_name: Optional[str] = Field(default=None, description="Filter by scraper name")
-    data_type: Optional[DataType] = Field(default=None, description="Filter by data type")
-    jurisdiction_level: Optional[JurisdictionLevel] = Field(default=None, description="Filter by jurisdiction level")
+    data_type: Optional[DataTypeValue] = Field(default=None, description="Filter by data type")
+    jurisdiction_level: Optional[JurisdictionLevelValue] = Field(default=None, description="Filter by jurisdiction level")
     start_date: Optional[datetime] = Field(default=None, description="Start date filter")
     end_date: Optional[datetime] = Field(default=None, description="End date filter")
     format: str = Field(default="json", description="Export format (json, csv, xml)")
@@ -204,8 +227,10 @@ class DataExportRequest(BaseScraperModel):
 
 class HealthStatus(BaseScraperModel):
     """Health status model"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     status: str = Field(..., description="Overall health status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Health check timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Health check timestamp")
     version: str = Field(..., description="Service version")
     uptime: float = Field(..., description="Service uptime in seconds")
     services: Dict[str, str] = Field(..., description="Individual service statuses")
@@ -213,6 +238,9 @@ class HealthStatus(BaseScraperModel):
 
 class MetricsSummary(BaseScraperModel):
     """Metrics summary model"""
+    # Validated from ScraperManager's summary dict, so extra keys are ignored rather than rejected
+    model_config = ConfigDict(frozen=True)
+    
     total_scrapers: int = Field(..., description="Total number of scrapers")
     active_scrapers: int = Field(..., description="Number of active scrapers")
     total_jobs: int = Field(..., description="Total number of jobs")
@@ -221,11 +249,11 @@ class MetricsSummary(BaseScraperModel):
     success_rate: float = Field(..., description="Overall success rate")
     avg_response_time: float = Field(..., description="Average response time")
     error_rate: float = Field(..., description="Overall error rate")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Metrics timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Metrics timestamp")
 
 class Alert(BaseScraperModel):
     """Alert model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique alert identifier")
+    id: str = Field(default_factory=_new_id, description="Unique alert identifier")
     level: str = Field(..., description="Alert level (info, warning, error, critical)")
     title: str = Field(..., description="Alert title")
     message: str = Field(..., description="Alert message")
@@ -233,7 +261,7 @@ class Alert(BaseScraperModel):
     job_id: Optional[str] = Field(default=None, description="Associated job")
     acknowledged: bool = Field(default=False, description="Whether alert is acknowledged")
     acknowledged_at: Optional[datetime] = Field(default=None, description="Acknowledgment timestamp")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Alert creation timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Alert creation timestamp")
 
 # ============================================================================
 # VALIDATION MODELS
@@ -241,20 +269,24 @@ class Alert(BaseScraperModel):
 
 class DataValidationResult(BaseScraperModel):
     """Data validation result model"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     record_id: str = Field(..., description="Record identifier")
     validation_status: str = Field(..., description="Validation status")
     quality_score: float = Field(..., description="Quality score (0-100)")
     validation_errors: List[str] = Field(default_factory=list, description="Validation errors")
     validation_warnings: List[str] = Field(default_factory=list, description="Validation warnings")
-    validation_timestamp: datetime = Field(default_factory=datetime.utcnow, description="Validation timestamp")
+    validation_timestamp: datetime = Field(default_factory=_now, description="Validation timestamp")
 
 # ============================================================================
 # UTILITY MODELS
 # ============================================================================
 
-class PaginatedResponse(BaseScraperModel):
+class PaginatedResponse(BaseScraperModel, Generic[T]):
     """Generic paginated response model"""
-    data: List[Any] = Field(..., description="Response data")
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    data: List[T] = Field(..., description="Response data")
     total: int = Field(..., description="Total number of items")
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
@@ -262,13 +294,31 @@ class PaginatedResponse(BaseScraperModel):
 
 class ErrorResponse(BaseScraperModel):
     """Error response model"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(default=None, description="Error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Error timestamp")
     request_id: Optional[str] = Field(default=None, description="Request identifier")
 
 class SuccessResponse(BaseScraperModel):
     """Success response model"""
+    model_config = RESPONSE_MODEL_CONFIG
+    
     message: str = Field(..., description="Success message")
     data: Optional[Any] = Field(default=None, description="Response data")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Response timestamp")
+
+# ============================================================================
+# TYPE ADAPTERS
+# ============================================================================
+
+# Concrete parametrizations, created once so routes and adapters share one specialized schema
+PaginatedDataRecords = PaginatedResponse[DataRecord]
+PaginatedJobs = PaginatedResponse[ScraperJob]
+
+# Built once at import; constructing a TypeAdapter rebuilds its validator and serializer
+DATA_RECORD_LIST_ADAPTER = TypeAdapter(List[DataRecord])
+JOB_LIST_ADAPTER = TypeAdapter(List[ScraperJob])
+PAGINATED_DATA_ADAPTER = TypeAdapter(PaginatedDataRecords)
+PAGINATED_JOB_ADAPTER = TypeAdapter(PaginatedJobs)
@@ -0,0 +1,52 @@
+"""
+Custom route classes for OpenPolicy Scraper Service
+"""
+
+from typing import Callable, Optional, Type
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+
+class FastJSONRoute(APIRoute):
+    """Route that validates a single Pydantic JSON body straight from the raw bytes
+
+    FastAPI normally decodes the body with json.loads and then validates the
+    resulting dict. For routes whose only body parameter is a model, this route
+    calls model_validate_json on the bytes instead and hands FastAPI the parsed
+    model, which it accepts without revalidating. Invalid bodies fall through to
+    FastAPI's own parsing so clients still get the standard 422 response.
+    """
+
+    def _single_body_model(self) -> Optional[Type[BaseModel]]:
+        """Return the model of the route's only, non-embedded body parameter"""
+        body_params = self.dependant.body_params
+        if len(body_params) != 1:
+            return None
+
+        field_info = body_params[0].field_info
+        model = field_info.annotation
+        if getattr(field_info, "embed", False) or not (isinstance(model, type) and issubclass(model, BaseModel)):
+            return None
+        return model
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        # APIRoute.__init__ builds the handler right after the dependant, so resolve the model here
+        body_model = self._single_body_model()
+        if body_model is None:
+            return original_route_handler
+
+        async def route_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type", "")
+            if not content_type or content_type.split(";", 1)[0].strip().endswith("json"):
+                body = await request.body()
+                if body:
+                    try:
+                        # Request.json() returns this cached value, so FastAPI never runs json.loads
+                        request._json = body_model.model_validate_json(body)
+                    except ValidationError:
+                        pass
+            return await original_route_handler(request)
+
+        return route_handler
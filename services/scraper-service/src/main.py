@@ -6,13 +6,15 @@ including parliamentary data, civic data, and external data sources.
 Features dual database support (test/prod) and efficiency optimizations.
 """
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
+import orjson
 import uvicorn
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
 
 # Add src directory to path
@@ -21,7 +23,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import config
 from src.core.logging_config import setup_logging, get_logger
 from src.core.monitoring import setup_monitoring
-from src.core.database import init_db, close_db
+from src.core.database import init_db_async, close_db
 from src.middleware.logging import LoggingMiddleware
 from src.middleware.monitoring import MonitoringMiddleware
 from src.routes import scrapers, jobs, data, monitoring
@@ -34,47 +36,20 @@ logger = get_logger(__name__)
 if config.METRICS_ENABLED:
     setup_monitoring()
 
-# Create FastAPI application
-app = FastAPI(
-    title="OpenPolicy Scraper Service v2.0",
-    description="Data scraping and collection service for OpenPolicy platform with dual DB support",
-    version="2.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure as needed
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Global scraper manager instance
+scraper_manager = None
 
-# Custom middleware
-try:
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(MonitoringMiddleware)
-except Exception as e:
-    logger.warning(f"Could not add custom middleware: {e}")
+class OrjsonResponse(Response):
+    """JSON response for handlers that build their own dicts; orjson encodes datetimes natively"""
 
-# Include routers
-try:
-    app.include_router(scrapers.router, prefix="/api/v1/scrapers", tags=["Scrapers"])
-    app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["Jobs"])
-    app.include_router(data.router, prefix="/api/v1/data", tags=["Data"])
-    app.include_router(monitoring.router, prefix="/api/v1/monitoring", tags=["Monitoring"])
-except Exception as e:
-    logger.warning(f"Could not include routers: {e}")
+    media_type = "application/json"
 
-# Global scraper manager instance
-scraper_manager = None
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup with efficiency optimizations"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and release them on shutdown, even if serving fails"""
     global scraper_manager
     
     try:
@@ -89,7 +64,7 @@ async def startup_event():
         try:
             if config.ENABLE_CONNECTION_POOLING:
                 logger.info("Initializing database with connection pooling...")
-            init_db()
+            await init_db_async()
         except Exception as e:
             logger.warning(f"Database initialization failed: {e}")
         
@@ -104,14 +79,12 @@ async def startup_event():
         logger.info("Scraper Service v2.0 started successfully")
     except Exception as e:
         logger.error(f"Failed to start Scraper Service: {e}")
+        await close_db()
         raise
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup services on shutdown"""
-    global scraper_manager
     
     try:
+        yield
+    finally:
         logger.info("Shutting down OpenPolicy Scraper Service...")
         if scraper_manager:
             try:
@@ -119,38 +92,80 @@ async def shutdown_event():
             except Exception as e:
                 logger.warning(f"Scraper Manager cleanup failed: {e}")
         
-        # Close database connections
+        # Close database connections; disposes both pools
         try:
-            close_db()
+            await close_db()
         except Exception as e:
             logger.warning(f"Database cleanup failed: {e}")
         
         logger.info("Scraper Service shutdown complete")
-    except Exception as e:
-        logger.error(f"Error during shutdown: {e}")
+
+# Create FastAPI application
+app = FastAPI(
+    title="OpenPolicy Scraper Service v2.0",
+    description="Data scraping and collection service for OpenPolicy platform with dual DB support",
+    version="2.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    openapi_url="/openapi.json",
+    lifespan=lifespan
+)
+
+# CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Configure as needed
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Custom middleware
+try:
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(MonitoringMiddleware)
+except Exception as e:
+    logger.warning(f"Could not add custom middleware: {e}")
+
+# Include routers; the request-heavy ones validate bodies via FastJSONRoute
+try:
+    app.include_router(scrapers.router, prefix="/api/v1/scrapers", tags=["Scrapers"])
+    app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["Jobs"])
+    app.include_router(data.router, prefix="/api/v1/data", tags=["Data"])
+    app.include_router(monitoring.router, prefix="/api/v1/monitoring", tags=["Monitoring"])
+except Exception as e:
+    logger.warning(f"Could not include routers: {e}")
 
 # Health check endpoints
+
+# /healthz body minus its timestamp, encoded once; only the timestamp is spliced in per probe
+_HEALTHZ_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "service": "scraper-service",
+    "version": "2.0.0",
+    "mode": config.mode,
+    "database": config.DATABASE_NAME,
+    "optimizations": {
+        "connection_pooling": config.ENABLE_CONNECTION_POOLING,
+        "query_caching": config.ENABLE_QUERY_CACHING,
+        "batch_processing": config.ENABLE_BATCH_PROCESSING,
+        "async_processing": config.ENABLE_ASYNC_PROCESSING
+    }
+})[:-1] + b',"timestamp":"'
+_HEALTHZ_SUFFIX = b'"}'
+
 @app.get("/healthz", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "scraper-service",
-        "version": "2.0.0",
-        "mode": config.mode,
-        "database": config.DATABASE_NAME,
-        "timestamp": datetime.utcnow().isoformat(),
-        "optimizations": {
-            "connection_pooling": config.ENABLE_CONNECTION_POOLING,
-            "query_caching": config.ENABLE_QUERY_CACHING,
-            "batch_processing": config.ENABLE_BATCH_PROCESSING,
-            "async_processing": config.ENABLE_ASYNC_PROCESSING
-        }
-    }
+    return Response(
+        content=_HEALTHZ_PREFIX + datetime.now(timezone.utc).isoformat().encode() + _HEALTHZ_SUFFIX,
+        media_type="application/json"
+    )
 
 @app.get("/readyz", tags=["Health"])
 async def readiness_check():
     """Readiness check endpoint"""
+    now = datetime.now(timezone.utc)
     try:
         # Check if scraper manager is ready
         if scraper_manager and hasattr(scraper_manager, 'is_ready'):
@@ -158,20 +173,20 @@ async def readiness_check():
         else:
             ready = scraper_manager is not None
         
-        return {
+        return OrjsonResponse({
             "status": "ready" if ready else "not_ready",
             "service": "scraper-service",
             "mode": config.mode,
             "database": config.DATABASE_NAME,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": now
+        })
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return {
+        return OrjsonResponse({
             "status": "not_ready",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": now
+        })
 
 # Mode information endpoint
 @app.get("/mode", tags=["Configuration"])
@@ -263,12 +278,12 @@ async def root():
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler with logging"""
     logger.error(f"Global exception handler: {exc} for request {request.url}")
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=500,
         content={
             "error": "Internal server error",
             "message": str(exc),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "mode": config.mode
         }
     )
@@ -11,8 +11,8 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
     """Middleware for monitoring HTTP requests"""
     
     async def dispatch(self, request: Request, call_next):
-        # Start time
-        start_time = time.time()
+        # Start time; monotonic, so durations are immune to wall-clock adjustments
+        start_time = time.monotonic()
         
         # Extract scraper name from path if available
         scraper_name = "unknown"
@@ -26,7 +26,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             
             # Record metrics
             record_scraper_request(scraper_name, "success")
@@ -36,7 +36,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             
         except Exception as e:
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             
             # Record error metrics
             record_scraper_request(scraper_name, "error")
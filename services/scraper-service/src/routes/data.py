@@ -8,12 +8,13 @@ from datetime import datetime
 
 from src.core.models import (
     DataRecord, DataQueryRequest, DataExportRequest, 
-    DataType, JurisdictionLevel, PaginatedResponse
+    DataType, JurisdictionLevel, PaginatedDataRecords
 )
+from src.core.routing import FastJSONRoute
 from src.services.scraper_manager import ScraperManager
 from src.core.monitoring import record_scraper_request, record_data_collected
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Global scraper manager instance
 scraper_manager = None
@@ -24,7 +25,7 @@ async def startup_event():
     global scraper_manager
     scraper_manager = ScraperManager()
 
-@router.get("/", response_model=PaginatedResponse)
+@router.get("/", response_model=PaginatedDataRecords)
 async def get_data(request: DataQueryRequest):
     """Get scraped data with filtering and pagination"""
     try:
@@ -55,7 +56,7 @@ async def get_data(request: DataQueryRequest):
         
         record_data_collected("data_retrieval", "query")
         
-        return PaginatedResponse(
+        return PaginatedDataRecords(
             data=data,
             total=total,
             page=(request.offset // request.limit) + 1,
@@ -10,10 +10,11 @@ from src.core.models import (
     ScraperJob, JobCreateRequest, JobUpdateRequest, 
     JobStatus, ScraperPriority, PaginatedResponse
 )
+from src.core.routing import FastJSONRoute
 from src.services.scraper_manager import ScraperManager
 from src.core.monitoring import record_scraper_request
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Global scraper manager instance
 scraper_manager = None
@@ -39,6 +40,7 @@ async def get_jobs(
         jobs = await scraper_manager.get_jobs(status, scraper_name, limit, offset)
         total = await scraper_manager.get_jobs_count(status, scraper_name)
         
+        # Jobs pass through unvalidated (data: List[Any]), as the scraper manager returns them
         return PaginatedResponse(
             data=jobs,
             total=total,
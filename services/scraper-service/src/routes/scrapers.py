@@ -11,10 +11,11 @@ from src.core.models import (
     ScraperInfo, ScraperRunRequest, ScraperRunResponse, 
     ScraperConfiguration, ScraperStatus, ScraperPriority
 )
+from src.core.routing import FastJSONRoute
 from src.services.scraper_manager import ScraperManager
 from src.core.monitoring import record_scraper_request, record_data_collected
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Global scraper manager instance
 scraper_manager = None
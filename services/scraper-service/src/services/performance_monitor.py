@@ -56,12 +56,17 @@ class PerformanceMonitor:
                 
         return summary
         
+    @staticmethod
+    def _sample_system():
+        """Sample CPU, memory and disk usage (blocking: the CPU sample takes one second)."""
+        return psutil.cpu_percent(interval=1), psutil.virtual_memory(), psutil.disk_usage('/')
+        
     async def get_system_metrics(self) -> Dict[str, Any]:
         """Get current system performance metrics."""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            # Sample in a worker thread so the one-second CPU measurement never blocks the event loop
+            loop = asyncio.get_running_loop()
+            cpu_percent, memory, disk = await loop.run_in_executor(None, self._sample_system)
             
             return {
                 'cpu_usage': cpu_percent,
@@ -1,7 +1,9 @@
 """
 Shared test fixtures and configuration for OpenPolicy Scraper Service tests.
 """
+import importlib.util
 import os
+import sys
 import tempfile
 import pytest
 from pathlib import Path
@@ -10,6 +12,27 @@ from unittest.mock import Mock, patch
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
 
+# Service root, the directory the src package and service scripts live in
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+
+@pytest.fixture(scope="function")
+def load_service_module(monkeypatch):
+    """Load a fresh copy of a service module from its path relative to the service root.
+    
+    Importing the src.core package runs its __init__, which needs the full service config,
+    so unit tests load the modules under src/core directly from their files.
+    """
+    def load(relative_path):
+        path = SERVICE_DIR / relative_path
+        spec = importlib.util.spec_from_file_location(f"{path.stem}_under_test", path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered for code that looks its own module up, such as pydantic generic models
+        monkeypatch.setitem(sys.modules, spec.name, module)
+        spec.loader.exec_module(module)
+        return module
+    
+    return load
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Provide test data directory path."""
@@ -0,0 +1,82 @@
+"""
+Unit tests for queued structured logging in src.core.logging_config.
+"""
+import io
+import json
+import logging
+import logging.handlers
+import queue
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("orjson")
+
+
+@pytest.mark.unit
+class TestLoggingConfigUnit:
+    """Test that records written through the log queue keep their exception details."""
+
+    @pytest.fixture
+    def logging_config(self, load_service_module):
+        """Load the logging configuration module."""
+        return load_service_module("src/core/logging_config.py")
+
+    @pytest.fixture
+    def queued_logger(self, logging_config):
+        """Provide a logger whose records reach a StructuredFormatter stream through the log queue."""
+        stream = io.StringIO()
+        stream_handler = logging.StreamHandler(stream)
+        stream_handler.setFormatter(logging_config.StructuredFormatter())
+
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        logger = logging.getLogger("test_logging_config.queued")
+        logger.propagate = False
+        logger.addHandler(logging_config.LocalQueueHandler(log_queue))
+        listener.start()
+        stopped = []
+
+        def read_entries():
+            """Stop the listener so every queued record is written, then parse the JSON lines."""
+            listener.stop()
+            stopped.append(True)
+            return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+        yield logger, read_entries
+
+        if not stopped:
+            listener.stop()
+        logger.handlers.clear()
+
+    def test_queued_exception_keeps_structured_exception_field(self, queued_logger):
+        """Test that logger.exception through the queue fills the JSON exception field."""
+        logger, read_entries = queued_logger
+
+        try:
+            raise ValueError("bad scraper config")
+        except ValueError:
+            logger.exception("Scraper %s failed", "federal")
+
+        [entry] = read_entries()
+        assert entry["message"] == "Scraper federal failed"
+        assert entry["exception"]["type"] == "ValueError"
+        assert entry["exception"]["message"] == "bad scraper config"
+        assert "bad scraper config" in "".join(entry["exception"]["traceback"])
+
+    def test_activity_details_serialized_only_when_enabled(self, logging_config, monkeypatch, request):
+        """Test that scraper activity details are only dumped to JSON when INFO records are emitted."""
+        dumps = Mock(return_value="{}")
+        monkeypatch.setattr(logging_config, "_dumps", dumps)
+        scrapers_logger = logging.getLogger("scrapers")
+        request.addfinalizer(partial(scrapers_logger.setLevel, scrapers_logger.level))
+        monkeypatch.setattr(scrapers_logger, "disabled", False)
+        scrapers_logger.setLevel(logging.WARNING)
+
+        logging_config.log_scraper_activity(1, "started", {"url": "https://example.com"})
+        dumps.assert_not_called()
+
+        scrapers_logger.setLevel(logging.INFO)
+        logging_config.log_scraper_activity(1, "started", {"url": "https://example.com"})
+        dumps.assert_called_once_with({"url": "https://example.com"})
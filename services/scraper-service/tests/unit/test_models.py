@@ -0,0 +1,66 @@
+"""
+Unit tests for the paginated response serialization in src.core.models.
+"""
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+STARTED_AT = datetime(2026, 1, 15, 9, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+class TestPaginatedResponseModel:
+    """Test that the prebuilt adapters serialize pages the way the routes' response models do."""
+
+    @pytest.fixture
+    def models(self, load_service_module):
+        """Load the models module."""
+        return load_service_module("src/core/models.py")
+
+    def test_paginated_jobs_dump_json_matches_response_model(self, models):
+        """Test that a page of jobs dumps to the same JSON as the response model, with enums as values."""
+        job = models.ScraperJob(
+            scraper_name="federal_bills",
+            priority=models.ScraperPriority.HIGH,
+            started_at=STARTED_AT,
+        )
+        page = models.PaginatedJobs(data=[job], total=3, page=2, size=1, pages=3)
+
+        body = json.loads(models.PAGINATED_JOB_ADAPTER.dump_json(page))
+
+        assert body == page.model_dump(mode="json")
+        assert {key: body[key] for key in ("total", "page", "size", "pages")} == {
+            "total": 3, "page": 2, "size": 1, "pages": 3
+        }
+        assert body["data"][0]["priority"] == "high"
+        assert body["data"][0]["status"] == "pending"
+        assert datetime.fromisoformat(body["data"][0]["started_at"].replace("Z", "+00:00")) == STARTED_AT
+        assert models.PAGINATED_JOB_ADAPTER.validate_json(json.dumps(body)) == page
+
+    def test_paginated_data_records_dump_json_matches_response_model(self, models):
+        """Test that a page of data records dumps to the same JSON as the response model."""
+        record = models.DataRecord(
+            scraper_name="ontario_mpps",
+            data_type="representatives",
+            jurisdiction_level="provincial",
+            jurisdiction_name="Ontario",
+            raw_data={"name": "Jane Doe", "riding": "Ottawa Centre"},
+        )
+        page = models.PaginatedDataRecords(data=[record], total=1, page=1, size=100, pages=1)
+
+        body = json.loads(models.PAGINATED_DATA_ADAPTER.dump_json(page))
+
+        assert body == page.model_dump(mode="json")
+        assert body["data"][0]["raw_data"] == {"name": "Jane Doe", "riding": "Ottawa Centre"}
+        assert body["data"][0]["jurisdiction_level"] == "provincial"
+
+    def test_empty_page_dumps_empty_data_list(self, models):
+        """Test that a page past the last result still dumps its counts and an empty data list."""
+        page = models.PaginatedJobs(data=[], total=0, page=1, size=100, pages=0)
+
+        body = json.loads(models.PAGINATED_JOB_ADAPTER.dump_json(page))
+
+        assert body == {"data": [], "total": 0, "page": 1, "size": 100, "pages": 0}
@@ -0,0 +1,162 @@
+"""
+Unit tests for the adaptive check scheduling in monitor_and_debug.
+"""
+import asyncio
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("psutil")
+pytest.importorskip("orjson")
+
+SERVICE_DIR = Path(__file__).resolve().parents[2]
+
+# Service modules the monitor imports at module level; the scheduler never touches them
+SERVICE_MODULES = {
+    "src.services.scraper_manager": "ScraperManager",
+    "src.services.data_pipeline": "DataPipeline",
+    "src.services.etl_service": "ETLService",
+    "src.services.performance_monitor": "PerformanceMonitor",
+    "src.services.coverage_validator": "CoverageValidator",
+}
+
+
+def make_sample(cpu_percent):
+    """Build a (cpu, memory, disk, network) system sample with healthy memory and disk."""
+    return (
+        cpu_percent,
+        SimpleNamespace(percent=10.0),
+        SimpleNamespace(percent=10.0),
+        SimpleNamespace(bytes_sent=0, bytes_recv=0),
+    )
+
+
+@pytest.mark.unit
+class TestMonitorSchedulerUnit:
+    """Test polling intervals, check scheduling and system sample reuse."""
+
+    @pytest.fixture
+    def monitor_module(self, monkeypatch, load_service_module):
+        """Load a fresh copy of monitor_and_debug with its service modules mocked out."""
+        for module_name, class_name in SERVICE_MODULES.items():
+            module = types.ModuleType(module_name)
+            setattr(module, class_name, Mock())
+            monkeypatch.setitem(sys.modules, module_name, module)
+
+        # The monitor imports from src.core by name, so stand in a bare package for its __init__
+        core = types.ModuleType("src.core")
+        core.__path__ = [str(SERVICE_DIR / "src" / "core")]
+        monkeypatch.setitem(sys.modules, "src.core", core)
+        monkeypatch.delitem(sys.modules, "src.core.logging_config", raising=False)
+
+        return load_service_module("monitor_and_debug.py")
+
+    @pytest.fixture
+    def monitor(self, monitor_module):
+        """Provide a monitor instance and shut down its coverage worker afterwards."""
+        monitor = monitor_module.ComprehensiveMonitor()
+        yield monitor
+        monitor._coverage_pool.shutdown(wait=False)
+
+    def test_poll_interval_shrinks_and_grows_within_bounds(self, monitor_module):
+        """Test that issues halve the interval down to its floor and clean checks double it up to its cap."""
+        interval = monitor_module.PollInterval(16)
+
+        assert [interval.update(healthy=False) for _ in range(3)] == [8, 4, 2]
+        assert interval.update(healthy=False) == 2
+        assert [interval.update(healthy=True) for _ in range(6)] == [4, 8, 16, 32, 64, 64]
+
+    def test_run_check_tightens_interval_only_when_issues_recorded(self, monitor_module, monitor):
+        """Test that a check recording an issue shrinks its interval and a clean check grows it."""
+        monitor.intervals = {"flaky": monitor_module.PollInterval(30)}
+
+        async def failing_check():
+            monitor._record_performance_issue("slow", 5.0, {})
+
+        async def clean_check():
+            return None
+
+        asyncio.run(monitor._run_check("flaky", failing_check))
+        assert monitor.intervals["flaky"].cur == 15
+
+        asyncio.run(monitor._run_check("flaky", clean_check))
+        assert monitor.intervals["flaky"].cur == 30
+
+    def test_concurrent_checks_count_only_their_own_issues(self, monitor_module, monitor):
+        """Test that an issue recorded by one check does not tighten a clean check running alongside it."""
+        monitor.intervals = {name: monitor_module.PollInterval(30) for name in ("clean", "failing")}
+        clean_started = asyncio.Event()
+        issue_recorded = asyncio.Event()
+
+        async def clean_check():
+            clean_started.set()
+            await issue_recorded.wait()
+
+        async def failing_check():
+            await clean_started.wait()
+            monitor._record_performance_issue("slow", 5.0, {})
+            issue_recorded.set()
+
+        async def run_both():
+            await asyncio.gather(
+                monitor._run_check("clean", clean_check),
+                monitor._run_check("failing", failing_check),
+            )
+
+        asyncio.run(run_both())
+
+        assert monitor.intervals["clean"].cur == 60
+        assert monitor.intervals["failing"].cur == 15
+        assert monitor._issues_recorded == 1
+
+    def test_cached_sample_is_reused_without_duplicate_issues(self, monitor_module, monitor, monkeypatch):
+        """Test that a sample reused within the shrunken interval records no second issue."""
+        sample_system = Mock(return_value=make_sample(cpu_percent=99.0))
+        monkeypatch.setattr(monitor, "_sample_system", sample_system)
+        monitor.intervals = {"system_resources": monitor_module.PollInterval(15)}
+
+        async def check_twice():
+            await monitor._run_check("system_resources", monitor._check_system_resources)
+            await monitor._run_check("system_resources", monitor._check_system_resources)
+
+        asyncio.run(check_twice())
+
+        sample_system.assert_called_once()
+        assert monitor._issues_recorded == 1
+        assert monitor.intervals["system_resources"].cur == 15
+
+    def test_slow_check_does_not_delay_other_checks(self, monitor_module, monitor):
+        """Test that a check blocked on a slow call keeps running on its own while others stay on schedule."""
+        runs = {"slow": 0, "fast": 0}
+        release_slow = asyncio.Event()
+
+        async def slow_check():
+            runs["slow"] += 1
+            await release_slow.wait()
+
+        async def fast_check():
+            runs["fast"] += 1
+
+        monitor._checks = {"slow": slow_check, "fast": fast_check}
+        monitor.intervals = {
+            name: monitor_module.PollInterval(0.01, min_s=0.01, max_s=0.01) for name in monitor._checks
+        }
+
+        async def run_scheduler_briefly():
+            async with asyncio.TaskGroup() as task_group:
+                monitor._task_group = task_group
+                scheduler = task_group.create_task(monitor._run_scheduler())
+                await asyncio.sleep(0.2)
+                monitor_module.shutdown_event.set()
+                await scheduler
+
+        asyncio.run(run_scheduler_briefly())
+
+        assert runs["slow"] == 1
+        assert runs["fast"] > 3
+        assert not monitor._check_tasks
+
@@ -0,0 +1,78 @@
+"""
+Unit tests for the FastJSONRoute route class in src.core.routing.
+"""
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")  # Required by the test client
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class ScraperPayload(BaseModel):
+    """Request body used by the test endpoint."""
+    name: str
+    priority: int
+
+
+def make_client(route_class):
+    """Build a test client for an app with one body-validating endpoint using the given route class."""
+    router = APIRouter(route_class=route_class)
+
+    @router.post("/scrapers")
+    async def create_scraper(payload: ScraperPayload):
+        return {"name": payload.name, "priority": payload.priority, "model": type(payload).__name__}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestFastJSONRouteUnit:
+    """Test that FastJSONRoute responds exactly like FastAPI's default route."""
+
+    @pytest.fixture
+    def clients(self, load_service_module):
+        """Provide test clients for the fast route and for FastAPI's default route."""
+        routing = load_service_module("src/core/routing.py")
+        return make_client(routing.FastJSONRoute), make_client(APIRoute)
+
+    def test_valid_body_is_parsed_into_model(self, clients):
+        """Test that a valid JSON body reaches the endpoint as the declared model."""
+        fast_client, default_client = clients
+        body = {"name": "federal", "priority": 1}
+
+        response = fast_client.post("/scrapers", json=body)
+
+        assert response.status_code == 200
+        assert response.json() == {"name": "federal", "priority": 1, "model": "ScraperPayload"}
+        assert response.json() == default_client.post("/scrapers", json=body).json()
+
+    def test_invalid_body_returns_standard_validation_error(self, clients):
+        """Test that an invalid body gets FastAPI's usual 422 error shape."""
+        fast_client, default_client = clients
+        body = {"name": "federal", "priority": "high"}
+
+        response = fast_client.post("/scrapers", json=body)
+        default_response = default_client.post("/scrapers", json=body)
+
+        assert response.status_code == 422
+        assert response.json() == default_response.json()
+        assert response.json()["detail"][0]["loc"] == ["body", "priority"]
+
+    def test_non_json_content_type_is_left_to_fastapi(self, clients):
+        """Test that a body sent with a non-JSON content type is handled as FastAPI would."""
+        fast_client, default_client = clients
+        request = {
+            "content": b'{"name": "federal", "priority": 1}',
+            "headers": {"content-type": "text/plain"},
+        }
+
+        response = fast_client.post("/scrapers", **request)
+        default_response = default_client.post("/scrapers", **request)
+
+        assert response.status_code == default_response.status_code
+        assert response.json() == default_response.json()